@@ -9,16 +9,29 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 from plotly.subplots import make_subplots
 import networkx as nx
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
+from collections import Counter
+import hashlib
+import string
+import functools
+import heapq
+import math
 import sys
 import os
 import asyncio
 import logging
+import threading
+import time
+from pathlib import Path
+from types import MappingProxyType
+from dataclasses import asdict
 import requests
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Tuple
 
 # Add services to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'services'))
@@ -28,24 +41,55 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Utility functions
+@st.cache_resource
+def get_rng() -> np.random.Generator:
+    """Get the random generator shared across reruns for synthetic/demo data"""
+    return np.random.default_rng()
+
+def stable_seed(text: str) -> int:
+    """Derive a process-independent seed from text so cached synthetic data is reproducible"""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), 'little')
+
+# India Standard Time has a fixed offset and no DST
+IST = timezone(timedelta(hours=5, minutes=30), 'IST')
+
+# datetime.fromisoformat accepts a trailing 'Z' from Python 3.11 onwards
+if sys.version_info >= (3, 11):
+    parse_iso_timestamp = datetime.fromisoformat
+else:
+    def parse_iso_timestamp(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp, mapping a trailing 'Z' to UTC"""
+        return datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+# Batched results often repeat timestamp strings; datetimes are immutable so parses can be shared
+_parse_iso_timestamp_cached = functools.lru_cache(maxsize=8192)(parse_iso_timestamp)
+
 def calculate_time_span(nodes: List[Dict]) -> str:
     """Calculate time span of the network"""
     if not nodes:
         return "N/A"
     
     try:
-        timestamps = []
+        # Single pass: parse each timestamp once and track the running min/max
+        earliest = latest = None
+        count = 0
         for node in nodes:
             if 'timestamp' in node:
-                if isinstance(node['timestamp'], str):
-                    timestamps.append(datetime.fromisoformat(node['timestamp'].replace('Z', '+00:00')))
-                else:
-                    timestamps.append(node['timestamp'])
-        
-        if len(timestamps) < 2:
+                timestamp = node['timestamp']
+                if isinstance(timestamp, str):
+                    timestamp = _parse_iso_timestamp_cached(timestamp)
+                if earliest is None:
+                    earliest = latest = timestamp
+                elif timestamp < earliest:
+                    earliest = timestamp
+                elif timestamp > latest:
+                    latest = timestamp
+                count += 1
+        
+        if count < 2:
             return "N/A"
         
-        time_span = max(timestamps) - min(timestamps)
+        time_span = latest - earliest
         
         if time_span.days > 0:
             return f"{time_span.days} days"
@@ -111,17 +155,19 @@ except ImportError as e:
             """Mock hashtag search method"""
             # Generate mock data for hashtag search
             mock_results = []
+            rng = np.random.default_rng(stable_seed(hashtag))
+            now = datetime.now()
             for i in range(min(limit, 33)):  # Generate up to 33 results
                 mock_results.append({
                     'platform': 'Twitter',
-                    'author': f'@user_{np.random.randint(1000, 9999)}',
+                    'author': f'@user_{rng.integers(1000, 9999)}',
                     'content': f'Sample content related to {hashtag} - post {i+1}',
-                    'timestamp': (datetime.now() - timedelta(hours=np.random.randint(1, 48))).isoformat(),
-                    'engagement': np.random.randint(10, 1000),
-                    'sentiment': np.random.choice(['Positive', 'Negative', 'Neutral']),
-                    'likes': np.random.randint(5, 500),
-                    'shares': np.random.randint(0, 100),
-                    'comments': np.random.randint(0, 50)
+                    'timestamp': (now - timedelta(hours=int(rng.integers(1, 48)))).isoformat(),
+                    'engagement': int(rng.integers(10, 1000)),
+                    'sentiment': rng.choice(['Positive', 'Negative', 'Neutral']),
+                    'likes': int(rng.integers(5, 500)),
+                    'shares': int(rng.integers(0, 100)),
+                    'comments': int(rng.integers(0, 50))
                 })
             return mock_results
     
@@ -159,12 +205,13 @@ except ImportError as e:
                     if results and len(results) > 0:
                         # Convert to expected format
                         converted_results = []
+                        now_iso = datetime.now().isoformat()
                         for result in results:
                             converted_results.append({
                                 'platform': result.get('platform', 'twitter'),
                                 'author': result.get('author', '@unknown'),
                                 'content': result.get('content', ''),
-                                'timestamp': result.get('timestamp', datetime.now().isoformat()),
+                                'timestamp': result.get('timestamp', now_iso),
                                 'engagement': result.get('engagement', 0),
                                 'sentiment': result.get('sentiment', 'Neutral')
                             })
@@ -288,9 +335,10 @@ def generate_chronological_network_data(tracking_input: str, tracking_type: str,
                                        chronological_mode: str, time_precision: str, 
                                        network_depth: int) -> Dict[str, Any]:
     """Generate chronological network data for influence analysis"""
+    rng = np.random.default_rng(stable_seed(f"{tracking_type}:{tracking_input}"))
     
     # Base timestamp (original source)
-    base_time = datetime.now() - timedelta(hours=np.random.randint(1, 48))
+    base_time = datetime.now() - timedelta(hours=int(rng.integers(1, 48)))
     
     nodes = []
     edges = []
@@ -300,25 +348,27 @@ def generate_chronological_network_data(tracking_input: str, tracking_type: str,
         'id': 'source_0',
         'label': f'@original_user',
         'timestamp': base_time.isoformat(),
-        'influence_score': np.random.uniform(0.8, 1.0),
+        'influence_score': rng.uniform(0.8, 1.0),
         'platform': 'twitter',
         'node_type': 'source'
     }
     nodes.append(original_node)
     
-    # Generate propagation nodes
+    # Generate propagation nodes, tracking each depth's ids so parents are picked without rescanning all nodes
     current_time = base_time
+    prev_depth_ids = []
     for depth in range(1, network_depth + 1):
-        num_nodes_at_depth = np.random.randint(2, 6)
+        num_nodes_at_depth = rng.integers(2, 6)
+        depth_ids = []
         
         for i in range(num_nodes_at_depth):
             # Time progression based on precision
             if time_precision == "Minutes":
-                time_delta = timedelta(minutes=np.random.randint(1, 60))
+                time_delta = timedelta(minutes=int(rng.integers(1, 60)))
             elif time_precision == "Hours":
-                time_delta = timedelta(hours=np.random.randint(1, 12))
+                time_delta = timedelta(hours=int(rng.integers(1, 12)))
             else:  # Days
-                time_delta = timedelta(days=np.random.randint(1, 7))
+                time_delta = timedelta(days=int(rng.integers(1, 7)))
             
             current_time += time_delta
             
@@ -326,11 +376,12 @@ def generate_chronological_network_data(tracking_input: str, tracking_type: str,
                 'id': f'node_{depth}_{i}',
                 'label': f'@user_{depth}_{i}',
                 'timestamp': current_time.isoformat(),
-                'influence_score': np.random.uniform(0.3, 0.8) * (1 - depth * 0.1),
-                'platform': np.random.choice(['twitter', 'facebook', 'instagram', 'youtube']),
+                'influence_score': rng.uniform(0.3, 0.8) * (1 - depth * 0.1),
+                'platform': rng.choice(['twitter', 'facebook', 'instagram', 'youtube']),
                 'node_type': 'propagator'
             }
             nodes.append(node)
+            depth_ids.append(node['id'])
             
             # Create edges (connections)
             if depth == 1:
@@ -338,24 +389,24 @@ def generate_chronological_network_data(tracking_input: str, tracking_type: str,
                 edge = {
                     'source': 'source_0',
                     'target': node['id'],
-                    'weight': np.random.uniform(0.6, 1.0),
+                    'weight': rng.uniform(0.6, 1.0),
                     'time_diff': str(time_delta),
-                    'interaction_type': np.random.choice(['retweet', 'share', 'mention', 'reply'])
+                    'interaction_type': rng.choice(['retweet', 'share', 'mention', 'reply'])
                 }
                 edges.append(edge)
             else:
                 # Connect to previous depth nodes
-                prev_depth_nodes = [n for n in nodes if n['node_type'] == 'propagator' and f'node_{depth-1}_' in n['id']]
-                if prev_depth_nodes:
-                    parent_node = np.random.choice(prev_depth_nodes)
+                if prev_depth_ids:
                     edge = {
-                        'source': parent_node['id'],
+                        'source': prev_depth_ids[rng.integers(0, len(prev_depth_ids))],
                         'target': node['id'],
-                        'weight': np.random.uniform(0.4, 0.8),
+                        'weight': rng.uniform(0.4, 0.8),
                         'time_diff': str(time_delta),
-                        'interaction_type': np.random.choice(['retweet', 'share', 'mention', 'reply'])
+                        'interaction_type': rng.choice(['retweet', 'share', 'mention', 'reply'])
                     }
                     edges.append(edge)
+        
+        prev_depth_ids = depth_ids
     
     return {
         'nodes': nodes,
@@ -378,6 +429,19 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop shared across reruns and sessions"""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="dashboard-event-loop", daemon=True).start()
+    return loop
+
+def run_async(*coros) -> List[Any]:
+    """Run coroutines concurrently on the shared event loop and return their results in order"""
+    async def _gather():
+        return await asyncio.gather(*coros)
+    return asyncio.run_coroutine_threadsafe(_gather(), get_event_loop()).result()
+
 # Initialize services
 @st.cache_resource
 def initialize_services():
@@ -419,38 +483,146 @@ def initialize_services():
 
 def generate_synthetic_timeline_data(tracking_input: str, timeline_range: str) -> Dict[str, Any]:
     """Generate synthetic timeline data for demo purposes"""
+    rng = np.random.default_rng(stable_seed(f"{timeline_range}:{tracking_input}"))
     base_data = {
         'posts': [],
         'engagement_timeline': [],
         'sentiment_timeline': [],
         'geographic_spread': ['India', 'USA', 'UK'],
         'viral_metrics': {
-            'growth_rate': np.random.uniform(0.1, 0.3),
-            'reach': np.random.randint(10000, 50000),
-            'influence_score': np.random.uniform(0.6, 0.9)
+            'growth_rate': rng.uniform(0.1, 0.3),
+            'reach': int(rng.integers(10000, 50000)),
+            'influence_score': rng.uniform(0.6, 0.9)
         }
     }
     
     # Generate posts based on timeline range
     if timeline_range == "Last 24 Hours":
-        num_posts = np.random.randint(10, 25)
+        num_posts = rng.integers(10, 25)
     elif timeline_range == "Last 1 Week":
-        num_posts = np.random.randint(50, 100)
+        num_posts = rng.integers(50, 100)
     else:  # Last 1 Month
-        num_posts = np.random.randint(200, 500)
+        num_posts = rng.integers(200, 500)
     
+    now = datetime.now()
     for i in range(num_posts):
-        post_time = datetime.now() - timedelta(hours=np.random.randint(1, 720))
+        post_time = now - timedelta(hours=int(rng.integers(1, 720)))
         base_data['posts'].append({
             'id': f'synthetic_{i}',
             'content': f'Synthetic post about {tracking_input} - analysis #{i+1}',
             'timestamp': post_time.isoformat(),
-            'engagement': np.random.randint(50, 1000),
+            'engagement': int(rng.integers(50, 1000)),
             'platform': 'twitter'
         })
     
     return base_data
 
+# Bucket count and width for each timeline range; unknown ranges fall back to the last 24 hours
+TIMELINE_RANGE_SPEC = MappingProxyType({
+    "Last 24 Hours": (24, timedelta(hours=1)),
+    "Last 1 Week": (7, timedelta(days=1)),
+    "Last 1 Month": (30, timedelta(days=1))
+})
+DEFAULT_TIMELINE_RANGE_SPEC = TIMELINE_RANGE_SPEC["Last 24 Hours"]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def timeline_time_points(timeline_range: str, minute: int) -> List[datetime]:
+    """Bucket start times for a timeline range, anchored to the given epoch minute"""
+    now = datetime.fromtimestamp(minute * 60)
+    count, step = TIMELINE_RANGE_SPEC.get(timeline_range, DEFAULT_TIMELINE_RANGE_SPEC)
+    return [now - step * i for i in range(count, 0, -1)]
+
+# Engagement fields summed into a post's total, and the shared fallback for posts without metrics
+ENGAGEMENT_METRIC_KEYS = ('likes', 'shares', 'comments', 'views')
+EMPTY_ENGAGEMENT_METRICS = MappingProxyType({})
+
+def convert_realtime_to_timeline(search_results: List[Dict], timeline_range: str) -> Dict[str, Any]:
+    """Convert real-time search results to timeline format for visualization"""
+    
+    # Bucket start times, shared with every other conversion in the same minute
+    time_points = timeline_time_points(timeline_range, int(time.time() // 60))
+    
+    # Extract each post's time, engagement and sentiment, skipping posts with malformed fields
+    now = datetime.now()
+    posts = []
+    post_times = []
+    post_engagement = []
+    post_sentiment = []
+    skipped = 0
+    first_error = None
+    for post in search_results:
+        try:
+            timestamp = post.get('timestamp')
+            if isinstance(timestamp, str):
+                post_time = _parse_iso_timestamp_cached(timestamp)
+            elif isinstance(timestamp, datetime):
+                post_time = timestamp
+            else:
+                post_time = now  # Fallback
+            metrics = post.get('engagement_metrics') or EMPTY_ENGAGEMENT_METRICS
+            engagement_total = sum(float(metrics.get(key) or 0) for key in ENGAGEMENT_METRIC_KEYS)
+            sentiment_score = float(post.get('sentiment_score') or 0.0)
+            if not (math.isfinite(engagement_total) and math.isfinite(sentiment_score)):
+                raise ValueError("non-finite engagement or sentiment")
+        except Exception as e:
+            skipped += 1
+            first_error = first_error or e
+            continue
+        posts.append(post)
+        post_times.append(post_time)
+        post_engagement.append(engagement_total)
+        post_sentiment.append(sentiment_score)
+    
+    # One summary line per batch rather than one warning per malformed post
+    if skipped:
+        logger.warning("Skipped %d malformed posts (first error: %s)", skipped, first_error)
+    
+    n_posts = len(posts)
+    n_buckets = len(time_points)
+    post_ts = np.fromiter((post_time.timestamp() for post_time in post_times), dtype=np.float64, count=n_posts)
+    engagement = np.array(post_engagement, dtype=np.float64)
+    sentiment = np.array(post_sentiment, dtype=np.float64)
+    viral = np.minimum(engagement / 1000, 1.0)  # Normalize to 0-1
+    
+    # Each post falls in the bucket of the latest time point at or before it; older posts are dropped
+    bucket_edges = np.array([tp.timestamp() for tp in time_points])
+    buckets = np.searchsorted(bucket_edges, post_ts, side='right') - 1
+    in_range = buckets >= 0
+    buckets = buckets[in_range]
+    
+    post_counts = np.bincount(buckets, minlength=n_buckets)
+    engagement_counts = np.rint(np.bincount(buckets, weights=engagement[in_range], minlength=n_buckets)).astype(np.int64)
+    sentiment_sums = np.bincount(buckets, weights=sentiment[in_range], minlength=n_buckets)
+    viral_sums = np.bincount(buckets, weights=viral[in_range], minlength=n_buckets)
+    
+    # Average sentiment and viral score per time point
+    sentiment_scores = np.divide(sentiment_sums, post_counts, out=np.zeros(n_buckets), where=post_counts > 0)
+    viral_scores = np.divide(viral_sums, post_counts, out=np.zeros(n_buckets), where=post_counts > 0)
+    
+    # Top 10 in-range posts above the engagement threshold; only the winners are materialised
+    top_idx = heapq.nlargest(10, np.flatnonzero(in_range & (engagement > 100)).tolist(), key=engagement.__getitem__)
+    top_posts = [{
+        'content': posts[i].get('content', '')[:200] + '...',
+        'author': posts[i].get('author_handle', 'Unknown'),
+        'platform': posts[i].get('platform', 'unknown'),
+        'engagement': round(engagement[i]),
+        'timestamp': post_times[i].isoformat(),
+        'url': posts[i].get('url', '#')
+    } for i in top_idx]
+    
+    return {
+        'timestamps': [tp.isoformat() for tp in time_points],
+        'post_counts': post_counts.tolist(),
+        'engagement_counts': engagement_counts.tolist(),
+        'sentiment_scores': sentiment_scores.tolist(),
+        'viral_scores': viral_scores.tolist(),
+        'platforms': dict(Counter(posts[i].get('platform', 'unknown') for i in np.flatnonzero(in_range))),
+        'top_posts': top_posts,
+        'total_posts': len(search_results),
+        'total_engagement': round(engagement[in_range].sum()),
+        'avg_sentiment': float(sentiment[in_range].mean()) if in_range.any() else 0.0
+    }
+
 # Language Translation System
 TRANSLATIONS = {
     'en': {
@@ -530,6 +702,65 @@ def get_text(key):
     """Get translated text based on current language"""
     return TRANSLATIONS.get(st.session_state.language, TRANSLATIONS['en']).get(key, key)
 
+# Professional tab styling, injected once per run ahead of st.tabs
+TAB_CSS = """
+<style>
+    /* Tab container styling */
+    .stTabs [data-baseweb="tab-list"] {
+        gap: 8px;
+        background-color: #1a202c;
+        padding: 8px;
+        border-radius: 10px;
+        margin-bottom: 20px;
+    }
+    
+    /* Individual tab styling */
+    .stTabs [data-baseweb="tab"] {
+        height: 50px;
+        padding: 0px 20px;
+        background-color: #2d3748;
+        border-radius: 8px;
+        color: #a0aec0;
+        font-weight: 500;
+        border: 1px solid #4a5568;
+        transition: all 0.3s ease;
+    }
+    
+    /* Active tab styling */
+    .stTabs [aria-selected="true"] {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        border: 1px solid #667eea;
+        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
+    }
+    
+    /* Hover effect for inactive tabs */
+    .stTabs [data-baseweb="tab"]:hover {
+        background-color: #4a5568;
+        color: #e2e8f0;
+        border: 1px solid #667eea;
+    }
+    
+    /* Tab panel styling */
+    .stTabs [data-baseweb="tab-panel"] {
+        background-color: #f7fafc;
+        border-radius: 10px;
+        padding: 20px;
+        margin-top: 10px;
+        border: 1px solid #e2e8f0;
+    }
+    
+    /* Tab icons and text */
+    .stTabs [data-baseweb="tab"] p {
+        font-size: 14px;
+        margin: 0;
+        display: flex;
+        align-items: center;
+        gap: 8px;
+    }
+</style>
+"""
+
 # Custom CSS for Indian Government Theme
 def load_government_css():
     st.markdown("""
@@ -689,7 +920,7 @@ influence_calculator = services['influence']
 # Initialize sentiment model if available
 if hasattr(sentiment_model, 'initialize'):
     try:
-        asyncio.run(sentiment_model.initialize())
+        run_async(sentiment_model.initialize())
     except Exception as e:
         logger.warning(f"Could not initialize sentiment model: {e}")
 
@@ -741,6 +972,35 @@ def analyze_content_comprehensive(text: str, user_metadata: Dict = None) -> Dict
     
     return results
 
+@st.cache_resource
+def register_chart_templates() -> None:
+    """Register the shared layout templates for the compact analysis charts once per process"""
+    pio.templates['sentinel_compact'] = pio.templates.merge_templates(
+        pio.templates[pio.templates.default],
+        go.layout.Template(layout=dict(height=300))
+    )
+    pio.templates['sentinel_score'] = pio.templates.merge_templates(
+        pio.templates['sentinel_compact'],
+        go.layout.Template(layout=dict(yaxis=dict(range=[0, 1])))
+    )
+
+register_chart_templates()
+
+# Read-only colour maps shared by the dashboard charts
+PLATFORM_COLORS = MappingProxyType({
+    'twitter': '#1DA1F2',
+    'facebook': '#4267B2',
+    'instagram': '#E4405F',
+    'youtube': '#FF0000',
+    'reddit': '#FF4500'
+})
+# Lookup table for vectorised platform colouring; index -1 (unknown platform) hits the trailing fallback
+PLATFORM_INDEX = pd.Index(list(PLATFORM_COLORS))
+PLATFORM_COLOR_LUT = np.array(list(PLATFORM_COLORS.values()) + ['#888888'])
+ACTIVITY_COLORS = MappingProxyType({'High': '#FF6B35', 'Low': '#95A5A6'})
+SENTIMENT_COLORS = MappingProxyType({"Positive": "green", "Negative": "red", "Neutral": "gray"})
+SEARCH_SENTIMENT_COLORS = MappingProxyType({'Positive': '#4CAF50', 'Negative': '#F44336', 'Neutral': '#FFC107'})
+
 def create_sentiment_visualization(sentiment_data: Dict) -> go.Figure:
     """Create sentiment analysis visualization"""
     fig = go.Figure(data=[
@@ -755,25 +1015,21 @@ def create_sentiment_visualization(sentiment_data: Dict) -> go.Figure:
                   f"{sentiment_data.get('neutral', 0):.2%}"],
             textposition='auto'
         )
-    ])
-    
-    fig.update_layout(
+    ], layout=dict(
+        template='sentinel_score',
         title="Sentiment Analysis",
         xaxis_title="Sentiment",
-        yaxis_title="Score",
-        yaxis=dict(range=[0, 1]),
-        height=300
-    )
+        yaxis_title="Score"
+    ))
     
     return fig
 
 def create_behavior_patterns_chart(patterns: List[Dict]) -> go.Figure:
     """Create behavioral patterns visualization"""
     if not patterns:
-        fig = go.Figure()
+        fig = go.Figure(layout=dict(template='sentinel_compact', title="Behavioral Patterns"))
         fig.add_annotation(text="No behavioral patterns detected", 
                           xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
-        fig.update_layout(title="Behavioral Patterns", height=300)
         return fig
     
     # Handle different pattern formats
@@ -791,23 +1047,21 @@ def create_behavior_patterns_chart(patterns: List[Dict]) -> go.Figure:
             pattern_types.append(str(p))
             scores.append(0.5)
     
+    scores = np.asarray(scores, dtype=np.float64)
     fig = go.Figure(data=[
         go.Bar(
             x=pattern_types,
             y=scores,
             marker_color='#FF6B6B',
-            text=[f"{score:.2f}" for score in scores],
+            text=np.char.mod('%.2f', scores),
             textposition='auto'
         )
-    ])
-    
-    fig.update_layout(
+    ], layout=dict(
+        template='sentinel_score',
         title="Behavioral Pattern Analysis",
         xaxis_title="Pattern Type",
-        yaxis_title="Score",
-        yaxis=dict(range=[0, 1]),
-        height=300
-    )
+        yaxis_title="Score"
+    ))
     
     return fig
 
@@ -833,34 +1087,216 @@ def create_influence_gauge(influence_score: float) -> go.Figure:
                 'value': 0.8
             }
         }
-    ))
+    ), layout=dict(template='sentinel_compact'))
     
-    fig.update_layout(height=300)
     return fig
 
-# Language selection
-languages = language_support.get_supported_languages()
-
-# Handle different return formats from language support
-if isinstance(languages, dict) and languages:
-    # Check if it's the expected format
-    first_key = next(iter(languages))
-    if isinstance(languages[first_key], dict) and 'name' in languages[first_key]:
-        language_options = {code: f"{lang['name']} ({lang['native_name']})" for code, lang in languages.items()}
-    else:
-        # Fallback format
-        language_options = {code: str(lang) for code, lang in languages.items()}
-else:
-    # Default fallback
-    language_options = {
-        'en': 'English',
-        'hi': 'हिंदी (Hindi)',
-        'ta': 'தமிழ் (Tamil)',
-        'te': 'తెలుగు (Telugu)',
-        'bn': 'বাংলা (Bengali)'
-    }
-    languages = {code: {'name': name.split(' (')[0], 'native_name': name.split(' (')[1].rstrip(')') if ' (' in name else name} 
-                for code, name in language_options.items()}
+def timeline_df_key(df: pd.DataFrame) -> str:
+    """Stable content hash of a timeline DataFrame's numeric and datetime columns, used as a figure cache key"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name, column in df.select_dtypes(include=['number', 'datetime']).items():
+        digest.update(name.encode())
+        digest.update(np.ascontiguousarray(column.to_numpy()).tobytes())
+    return digest.hexdigest()
+
+# Upper bounds on markers/bars shipped to the browser for the map and category charts
+MAX_MAP_POINTS = 5000
+MAX_CATEGORY_BARS = 10
+
+def collapse_long_tail(counts: pd.Series, max_items: int = MAX_CATEGORY_BARS) -> pd.Series:
+    """Keep the largest categories of sorted value counts and fold the rest into 'Other'"""
+    if len(counts) <= max_items:
+        return counts
+    head = counts.iloc[:max_items - 1]
+    return pd.concat([head, pd.Series({'Other': counts.iloc[max_items - 1:].sum()})])
+
+# Content hashing for pandas arguments of cached figure builders
+def _hash_pandas(obj) -> bytes:
+    return pd.util.hash_pandas_object(obj, index=True).values.tobytes()
+
+PANDAS_HASH_FUNCS = {pd.DataFrame: _hash_pandas, pd.Series: _hash_pandas}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_engagement_fig(df_key: str, _df_timeline: pd.DataFrame, title: str, timezone_display: str) -> dict:
+    """Build the engagement timeline figure, cached on the DataFrame hash"""
+    fig = go.Figure(go.Scattergl(
+        x=_df_timeline['timestamp'],
+        y=_df_timeline['engagement'],
+        mode='lines',
+        name='Engagement Count',
+        line=dict(color='#FF6B35')
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=f"Time ({timezone_display})",
+        yaxis_title="Engagement Count",
+        hovermode='x unified'
+    )
+    return fig.to_dict()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_cumulative_fig(df_key: str, _df_timeline: pd.DataFrame, title: str, timezone_display: str) -> dict:
+    """Build the cumulative reach figure, cached on the DataFrame hash"""
+    fig = go.Figure(go.Scattergl(
+        x=_df_timeline['timestamp'],
+        y=_df_timeline['cumulative_reach'],
+        mode='lines',
+        name='Total Reach',
+        fill='tozeroy',
+        line=dict(color='#4ECDC4')
+    ))
+    fig.update_layout(
+        title=title,
+        xaxis_title=f"Time ({timezone_display})",
+        yaxis_title="Total Reach"
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs=PANDAS_HASH_FUNCS)
+def build_hourly_fig(df_hourly: pd.DataFrame) -> dict:
+    """Build the hourly IST engagement bar chart, cached on the hourly totals"""
+    fig = px.bar(
+        df_hourly,
+        x='hour',
+        y='engagement',
+        color='activity_level',
+        title="Hourly Engagement Pattern (IST)",
+        color_discrete_map=ACTIVITY_COLORS
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=16, hash_funcs=PANDAS_HASH_FUNCS)
+def build_propagation_fig(df_timeline: pd.DataFrame) -> dict:
+    """Build the chronological propagation scatter, cached on the timeline rows"""
+    fig = px.scatter(
+        df_timeline,
+        x='sequence',
+        y='influence_score',
+        color='platform',
+        size='influence_score',
+        hover_data=['user', 'timestamp_ist', 'role'],
+        title="Chronological Propagation Timeline",
+        labels={'sequence': 'Chronological Order', 'influence_score': 'Influence Score'}
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False)
+def compute_network_layout(node_ids: Tuple[str, ...], weighted_edges: Tuple[Tuple[str, str, float], ...]) -> Dict[str, np.ndarray]:
+    """Seeded spring layout for the influence network, cached on its topology and edge weights"""
+    G = nx.Graph()
+    G.add_nodes_from(node_ids)
+    G.add_weighted_edges_from(weighted_edges)
+    return nx.spring_layout(G, k=1, iterations=50, seed=42)
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def build_network_fig(network_data: Dict[str, Any], title: str, annotation: str) -> dict:
+    """Build the chronological influence network figure, cached on the network and its labels"""
+    # Create network graph
+    G = nx.Graph()
+    
+    # Add nodes with chronological data
+    G.add_nodes_from(
+        (node['id'], {
+            'label': node['label'],
+            'timestamp': node['timestamp'],
+            'influence_score': node['influence_score'],
+            'platform': node['platform']
+        })
+        for node in network_data['nodes']
+    )
+    
+    # Add edges with time-based weights
+    G.add_edges_from(
+        (edge['source'], edge['target'], {
+            'weight': edge['weight'],
+            'time_diff': edge['time_diff'],
+            'interaction_type': edge['interaction_type']
+        })
+        for edge in network_data['edges']
+    )
+    
+    # Calculate layout (reused across reruns while the network is unchanged)
+    pos = compute_network_layout(
+        tuple(G.nodes()),
+        tuple((u, v, data['weight']) for u, v, data in G.edges(data=True))
+    )
+    
+    # Create plotly network visualization
+    node_ids = list(G.nodes())
+    node_index = {node: i for i, node in enumerate(node_ids)}
+    pos_arr = np.array([pos[node] for node in node_ids], dtype=np.float64).reshape(-1, 2)
+    edge_idx = np.array([(node_index[u], node_index[v]) for u, v in G.edges()], dtype=np.intp).reshape(-1, 2)
+    
+    # Interleave (source, target, NaN) so each edge is its own line segment
+    edge_gap = np.full(len(edge_idx), np.nan)
+    edge_x = np.column_stack([pos_arr[edge_idx[:, 0], 0], pos_arr[edge_idx[:, 1], 0], edge_gap]).ravel()
+    edge_y = np.column_stack([pos_arr[edge_idx[:, 0], 1], pos_arr[edge_idx[:, 1], 1], edge_gap]).ravel()
+    
+    edge_trace = go.Scatter(
+        x=edge_x, y=edge_y,
+        line=dict(width=0.5, color='#888'),
+        hoverinfo='none',
+        mode='lines'
+    )
+    
+    # Node traces; attributes are gathered column-wise so hover text is built with vectorized string ops
+    node_x, node_y = pos_arr[:, 0], pos_arr[:, 1]
+    node_attrs = pd.DataFrame(
+        [G.nodes[node] for node in node_ids], index=node_ids,
+        columns=['label', 'platform', 'timestamp', 'influence_score']
+    )
+    labels = node_attrs['label'].fillna(pd.Series(node_ids, index=node_ids))
+    node_text = (
+        'User: ' + labels
+        + '<br>Platform: ' + node_attrs['platform'].fillna('Unknown')
+        + '<br>Timestamp: ' + node_attrs['timestamp'].fillna('N/A')
+        + '<br>Influence: ' + node_attrs['influence_score'].fillna(0).map('{:.2f}'.format)
+    ).tolist()
+    
+    # Color by platform
+    platform_codes = PLATFORM_INDEX.get_indexer(node_attrs['platform'].fillna('twitter'))
+    node_color = PLATFORM_COLOR_LUT[platform_codes]
+    
+    # Size by influence score
+    influences = node_attrs['influence_score'].fillna(0.5).to_numpy(dtype=np.float64)
+    node_size = np.maximum(10, influences * 30)
+    
+    node_trace = go.Scatter(
+        x=node_x, y=node_y,
+        mode='markers+text',
+        hoverinfo='text',
+        text=labels.tolist(),
+        textposition="middle center",
+        hovertext=node_text,
+        marker=dict(
+            size=node_size,
+            color=node_color,
+            line=dict(width=2, color='white')
+        )
+    )
+    
+    # Create figure
+    fig_network = go.Figure(
+        data=[edge_trace, node_trace],
+        layout=go.Layout(
+            title=dict(text=title, font=dict(size=16)),
+            showlegend=False,
+            hovermode='closest',
+            margin=dict(b=20,l=5,r=5,t=40),
+            annotations=[ dict(
+                text=annotation,
+                showarrow=False,
+                xref="paper", yref="paper",
+                x=0.005, y=-0.002,
+                xanchor='left', yanchor='bottom',
+                font=dict(color='gray', size=12)
+            )],
+            xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+            yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+            height=600
+        )
+    )
+    return fig_network.to_dict()
 
 # Sidebar for language selection
 with st.sidebar:
@@ -911,12 +1347,28 @@ with st.sidebar:
         authorized_officer = ""
 
 # Main dashboard
-def get_translation(key: str) -> str:
-    """Get translation for current language"""
+# Fallback translations used when the language service cannot resolve a key
+FALLBACK_TRANSLATIONS = {
+    "dashboard_title": "SentinelBERT - Social Media Analytics Dashboard",
+    "government_text": "Comprehensive Content Tracking & Analysis Platform - By Team: Code X",
+    "active_clusters": "Active Clusters",
+    "evidence_packages": "Evidence Packages", 
+    "high_priority": "High Priority Cases",
+    "officers_active": "Officers Active",
+    "viral_timeline": "Viral Timeline",
+    "influence_network": "Influence Network",
+    "geographic_spread": "Geographic Spread",
+    "evidence_collection": "Evidence Collection",
+    "time_range": "Time Range",
+    "platform_filter": "Platform Filter",
+    "collect_evidence": "Collect Evidence"
+}
+
+@functools.lru_cache(maxsize=2048)
+def _translate_cached(language: str, key: str) -> str:
+    """Resolve a UI translation for (language, key); results are memoized"""
     try:
-        # Use session state language or default to English
-        current_language = st.session_state.get('language', 'en')
-        translation = language_support.get_ui_translation(current_language, key)
+        translation = language_support.get_ui_translation(language, key)
         # Handle different return formats
         if isinstance(translation, dict):
             return str(translation.get('text', key))
@@ -926,23 +1378,12 @@ def get_translation(key: str) -> str:
             return str(translation) if translation else key
     except Exception as e:
         logger.warning(f"Translation error for key '{key}': {e}")
-        # Fallback translations
-        fallback_translations = {
-           "dashboard_title": "SentinelBERT - Social Media Analytics Dashboard",
-           "government_text": "Comprehensive Content Tracking & Analysis Platform - By Team: Code X",
-            "active_clusters": "Active Clusters",
-            "evidence_packages": "Evidence Packages", 
-            "high_priority": "High Priority Cases",
-            "officers_active": "Officers Active",
-            "viral_timeline": "Viral Timeline",
-            "influence_network": "Influence Network",
-            "geographic_spread": "Geographic Spread",
-            "evidence_collection": "Evidence Collection",
-            "time_range": "Time Range",
-            "platform_filter": "Platform Filter",
-            "collect_evidence": "Collect Evidence"
-        }
-        return fallback_translations.get(key, key)
+        return FALLBACK_TRANSLATIONS.get(key, key)
+
+def get_translation(key: str) -> str:
+    """Get translation for current language"""
+    # Use session state language or default to English
+    return _translate_cached(st.session_state.get('language', 'en'), key)
 
 # Load government CSS
 load_government_css()
@@ -993,11 +1434,14 @@ st.markdown("---")
 st.subheader("🌐 Platform Selection")
 
 # Get platform options
-all_platforms = platform_support.get_supported_platforms()
-indian_platforms = platform_support.get_indian_platforms()
+@st.cache_resource
+def load_available_platforms() -> Dict[str, Any]:
+    """Load the global platform catalog (excluding Indian-specific platforms) once per process"""
+    all_platforms = platform_support.get_supported_platforms()
+    indian_platforms = platform_support.get_indian_platforms()
+    return {k: v for k, v in all_platforms.items() if k not in indian_platforms}
 
-# Use only global platforms (excluding Indian-specific ones)
-available_platforms = {k: v for k, v in all_platforms.items() if k not in indian_platforms}
+available_platforms = load_available_platforms()
 
 # Handle platform format safely
 if available_platforms and isinstance(available_platforms, dict):
@@ -1054,6 +1498,33 @@ except ImportError:
     cache_available = False
     st.warning("⚠️ Cache system not available - using live API calls only")
 
+# Tracking cache rows fetched during this script run; rebound on every full rerun so hits never outlive it
+tracking_cache_lookups: Dict[Tuple[str, str, str], Any] = {}
+
+def lookup_tracking_cache(platforms: List[str], query_type: str, query_value: str,
+                          max_age: Optional[timedelta] = None) -> Dict[str, Any]:
+    """Get cached tracking data per platform, batching misses and reusing this run's hits while fresh"""
+    now = datetime.now()
+    keys = [(platform, query_type, query_value) for platform in platforms]
+    stale = [
+        key for key in keys
+        if key not in tracking_cache_lookups
+        or tracking_cache_lookups[key].expires_at <= now
+        or (max_age is not None and now - tracking_cache_lookups[key].timestamp >= max_age)
+    ]
+    if stale:
+        for key, cached in cache_db.get_cached_data_batch(stale).items():
+            if cached:
+                tracking_cache_lookups[key] = cached
+            else:
+                tracking_cache_lookups.pop(key, None)
+    return {platform: tracking_cache_lookups.get(key) for platform, key in zip(platforms, keys)}
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_trending_topic_options() -> List[str]:
+    """Get trending topic keywords from the tracking cache, refreshed every 10 minutes"""
+    return [t['keyword'] for t in cache_db.get_mock_trending_data()]
+
 # Tracking input options
 tracking_col1, tracking_col2 = st.columns([2, 1])
 
@@ -1084,8 +1555,7 @@ with tracking_col1:
     elif tracking_type == "📈 Trending Topic":
         # Get trending topics from cache if available
         if cache_available:
-            trending_topics = cache_db.get_mock_trending_data()
-            topic_options = [t['keyword'] for t in trending_topics]
+            topic_options = load_trending_topic_options()
             if topic_options:
                 tracking_input = st.selectbox(
                     "Select Trending Topic",
@@ -1135,8 +1605,9 @@ if st.button("🚀 Start Unified Tracking", type="primary", use_container_width=
         # Check cache first if available
         cached_data = None
         if cache_available and selected_platforms:
-            primary_platform = selected_platforms[0] if selected_platforms else 'twitter'
-            cached_data = cache_db.get_cached_data(primary_platform, query_type, tracking_input)
+            # One query covers every selected platform
+            cached_lookup = lookup_tracking_cache(selected_platforms, query_type, tracking_input.strip())
+            cached_data = cached_lookup[selected_platforms[0]]
         
         if cached_data:
             st.success(f"✅ Using cached data for '{tracking_input}' (Cache hit!)")
@@ -1152,6 +1623,14 @@ if st.button("🚀 Start Unified Tracking", type="primary", use_container_width=
     else:
         st.error("Please enter a valid input for tracking")
 
+@st.fragment(run_every=5)
+def show_tracking_duration():
+    """Show elapsed tracking time, refreshed on its own 5s heartbeat"""
+    tracking_time = st.session_state.get('tracking_timestamp')
+    if tracking_time:
+        total = int((datetime.now() - tracking_time).total_seconds())
+        st.info(f"**Duration:** {total // 3600:02d}:{total % 3600 // 60:02d}:{total % 60:02d}")
+
 # Display current tracking status
 if st.session_state.get('tracking_active', False):
     st.markdown("---")
@@ -1166,10 +1645,7 @@ if st.session_state.get('tracking_active', False):
     with status_col2:
         platforms_str = ", ".join(st.session_state.get('tracking_platforms', []))
         st.info(f"**Platforms:** {platforms_str}")
-        tracking_time = st.session_state.get('tracking_timestamp')
-        if tracking_time:
-            time_diff = datetime.now() - tracking_time
-            st.info(f"**Duration:** {str(time_diff).split('.')[0]}")
+        show_tracking_duration()
     
     with status_col3:
         if st.session_state.get('api_calls_saved', False):
@@ -1190,66 +1666,11 @@ st.markdown("---")
 st.markdown("---")
 
 # Custom CSS for professional tab styling
-st.markdown("""
-<style>
-    /* Tab container styling */
-    .stTabs [data-baseweb="tab-list"] {
-        gap: 8px;
-        background-color: #1a202c;
-        padding: 8px;
-        border-radius: 10px;
-        margin-bottom: 20px;
-    }
-    
-    /* Individual tab styling */
-    .stTabs [data-baseweb="tab"] {
-        height: 50px;
-        padding: 0px 20px;
-        background-color: #2d3748;
-        border-radius: 8px;
-        color: #a0aec0;
-        font-weight: 500;
-        border: 1px solid #4a5568;
-        transition: all 0.3s ease;
-    }
-    
-    /* Active tab styling */
-    .stTabs [aria-selected="true"] {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: 1px solid #667eea;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
-    
-    /* Hover effect for inactive tabs */
-    .stTabs [data-baseweb="tab"]:hover {
-        background-color: #4a5568;
-        color: #e2e8f0;
-        border: 1px solid #667eea;
-    }
-    
-    /* Tab panel styling */
-    .stTabs [data-baseweb="tab-panel"] {
-        background-color: #f7fafc;
-        border-radius: 10px;
-        padding: 20px;
-        margin-top: 10px;
-        border: 1px solid #e2e8f0;
-    }
-    
-    /* Tab icons and text */
-    .stTabs [data-baseweb="tab"] p {
-        font-size: 14px;
-        margin: 0;
-        display: flex;
-        align-items: center;
-        gap: 8px;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(TAB_CSS, unsafe_allow_html=True)
 
 # Main content tabs
 try:
+    # Rerun on tab switches so only the selected tab's body executes (see tabN.open below)
     tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
         "📈 Viral Timeline",
         "🔍 Comprehensive Analysis", 
@@ -1258,7 +1679,7 @@ try:
         "🌍 Geographic Spread",
         "📋 Evidence Collection",
         "🔍 Real-time Search"
-    ])
+    ], key="main_tabs", on_change="rerun")
 except Exception as e:
     logger.error(f"Failed to create main tabs: {e}")
     show_error_popup(f"Failed to initialize dashboard tabs: {str(e)}", "UI Initialization Error")
@@ -1270,7 +1691,7 @@ def get_realtime_data_service():
     """Get real-time data service instance"""
     return RealTimeDataService()
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def get_twitter_hashtag_collector():
     """Get Twitter hashtag collector instance"""
     return TwitterHashtagCollector()
@@ -1282,8 +1703,82 @@ except Exception as e:
     logger.error(f"Failed to initialize real-time service: {e}")
     realtime_service = None
 
+def fetch_comprehensive_analysis(service, keywords: Tuple[str, ...], platforms: Tuple[str, ...]) -> Dict[str, Any]:
+    """Get comprehensive analysis data, empty and uncached while the real-time service is unavailable"""
+    if service is None:
+        return {"posts": [], "summary": {}, "trends": []}
+    return cached_comprehensive_analysis(service, keywords, platforms)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_comprehensive_analysis(_service, keywords: Tuple[str, ...], platforms: Tuple[str, ...]) -> Dict[str, Any]:
+    """Get comprehensive analysis data with plain-dict posts, reused for 60s per (keywords, platforms)"""
+    analysis_data = run_async(_service.get_comprehensive_analysis_data(
+        keywords=list(keywords),
+        platforms=list(platforms)
+    ))[0]
+    return {**analysis_data, "posts": [asdict(post) for post in analysis_data.get("posts", [])]}
+
+def fetch_sentiment_behavior(service, keywords: Tuple[str, ...], platforms: Tuple[str, ...]) -> Dict[str, Any]:
+    """Get sentiment and behavior data, empty and uncached while the real-time service is unavailable"""
+    if service is None:
+        return {"sentiment_timeline": [], "behavior_patterns": {}, "posts": []}
+    return cached_sentiment_behavior(service, keywords, platforms)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_sentiment_behavior(_service, keywords: Tuple[str, ...], platforms: Tuple[str, ...]) -> Dict[str, Any]:
+    """Get sentiment and behavior data with plain-dict posts, reused for 60s per (keywords, platforms)"""
+    sentiment_data = run_async(_service.get_sentiment_behavior_data(
+        keywords=list(keywords),
+        platforms=list(platforms)
+    ))[0]
+    return {**sentiment_data, "posts": [asdict(post) for post in sentiment_data.get("posts", [])]}
+
+def fetch_hashtag_data(collector, hashtag: str, limit: int) -> List[Dict[str, Any]]:
+    """Collect hashtag posts, empty and uncached while the hashtag collector is unavailable"""
+    if collector is None:
+        return []
+    return cached_hashtag_data(collector, hashtag, limit)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def cached_hashtag_data(_collector, hashtag: str, limit: int) -> List[Dict[str, Any]]:
+    """Collect hashtag posts, reused for 60s per (hashtag, limit)"""
+    return _collector.collect_hashtag_data(hashtag, limit)
+
+# Static instructions shown in the viral timeline tab until it has data
+VIRAL_TIMELINE_INSTRUCTIONS = """
+### 📈 Enhanced Viral Timeline Features
+
+When you start tracking content, this tab will show:
+
+#### 🕐 **24 Hours Analytics**
+- Hourly engagement patterns in IST timezone
+- Peak activity identification
+- Real-time growth tracking
+
+#### 📅 **1 Week Analytics** 
+- Daily viral spread patterns
+- Weekly trend analysis
+- Platform comparison over time
+
+#### 📆 **1 Month Analytics**
+- Long-term viral lifecycle
+- Sustained engagement analysis
+- Historical trend comparison
+
+#### 🔍 **Key Metrics**
+- Total engagement count
+- Peak engagement periods
+- Average growth rate
+- Cumulative reach analysis
+- Platform-wise breakdown
+
+**Start tracking above to see live analytics!**
+"""
+
 # Tab 1: Enhanced Viral Timeline with Unified Tracking
-with tab1:
+@st.fragment
+def render_viral_timeline():
+    """Render the viral timeline tab; its own widgets rerun only this fragment"""
     st.subheader("📈 Enhanced Viral Timeline Analytics")
     
     # Check if unified tracking is active
@@ -1326,57 +1821,64 @@ with tab1:
             try:
                 # Get real-time data from APIs
                 primary_platform = tracking_platforms[0] if tracking_platforms else 'twitter'
+                search_platforms = tracking_platforms or [primary_platform]
+                # The merged timeline covers every tracked platform, so cache it under the whole set
+                cache_platform = ','.join(sorted(search_platforms))
                 
                 # First check cache for recent data
-                cached_data = cache_db.get_cached_data(primary_platform, tracking_type, tracking_input)
+                cached_data = lookup_tracking_cache(
+                    [cache_platform], tracking_type, tracking_input, max_age=timedelta(minutes=5)
+                )[cache_platform]
                 
                 if cached_data and (datetime.now() - cached_data.timestamp).seconds < 300:  # 5 minutes cache
                     timeline_data = cached_data.data
                     st.info(f"📊 Using cached data from {cached_data.timestamp.strftime('%H:%M:%S')}")
                 else:
                     # Fetch real-time data from APIs
-                    st.info(f"🔄 Fetching real-time data for '{tracking_input}' from {primary_platform}...")
+                    st.info(f"🔄 Fetching real-time data for '{tracking_input}' from {', '.join(search_platforms)}...")
                     
                     try:
-                        # Use the real-time data service
-                        real_time_service = RealTimeDataService()
+                        # Reuse the process-wide real-time data service
+                        real_time_service = get_realtime_data_service()
                         
-                        if query_type == "hashtag":
+                        # Query every tracked platform concurrently on the shared event loop
+                        if tracking_type == "hashtag":
                             # Search for hashtag data
-                            import asyncio
-                            search_results = asyncio.run(real_time_service.search_hashtag(
+                            search_coros = [real_time_service.search_hashtag(
                                 hashtag=tracking_input,
-                                platforms=[primary_platform],
+                                platforms=[platform],
                                 max_results=100
-                            ))
-                        elif query_type == "url":
+                            ) for platform in search_platforms]
+                        elif tracking_type == "url":
                             # Search for URL mentions
-                            import asyncio
-                            search_results = asyncio.run(real_time_service.search_url_mentions(
+                            search_coros = [real_time_service.search_url_mentions(
                                 url=tracking_input,
-                                platforms=[primary_platform],
+                                platforms=[platform],
                                 max_results=100
-                            ))
+                            ) for platform in search_platforms]
                         else:
                             # General keyword search
-                            import asyncio
-                            search_results = asyncio.run(real_time_service.search_keywords(
+                            search_coros = [real_time_service.search_keywords(
                                 keywords=[tracking_input],
-                                platforms=[primary_platform],
+                                platforms=[platform],
                                 max_results=100
-                            ))
+                            ) for platform in search_platforms]
+                        
+                        search_results = [post for platform_results in run_async(*search_coros)
+                                          for post in platform_results or []]
                         
                         if search_results and len(search_results) > 0:
                             # Convert real-time data to timeline format
                             timeline_data = convert_realtime_to_timeline(search_results, timeline_range)
                             
                             # Cache the results
-                            cache_db.store_cached_data(
-                                platform=primary_platform,
+                            cache_db.cache_data(
+                                platform=cache_platform,
                                 query_type=tracking_type,
                                 query_value=tracking_input,
                                 data=timeline_data,
-                                ttl_hours=1
+                                cache_duration_hours=1,
+                                api_calls_used=len(search_platforms)
                             )
                             
                             st.success(f"✅ Found {len(search_results)} real-time posts for '{tracking_input}'")
@@ -1402,7 +1904,7 @@ with tab1:
             # Fallback to mock data when real-time is disabled
             try:
                 primary_platform = tracking_platforms[0] if tracking_platforms else 'twitter'
-                cached_data = cache_db.get_cached_data(primary_platform, tracking_type, tracking_input)
+                cached_data = lookup_tracking_cache([primary_platform], tracking_type, tracking_input)[primary_platform]
                 
                 if not cached_data:
                     # Use mock trending data
@@ -1418,124 +1920,98 @@ with tab1:
                 # Create timeline visualizations
                 st.markdown("### 📊 Viral Spread Timeline")
                 
-                # Generate time series data
-                if timeline_range == "Last 24 Hours":
-                    hours = 24
-                    time_points = [datetime.now() - timedelta(hours=i) for i in range(hours, 0, -1)]
-                elif timeline_range == "Last 1 Week":
-                    days = 7
-                    time_points = [datetime.now() - timedelta(days=i) for i in range(days, 0, -1)]
-                else:  # Last 1 Month
-                    days = 30
-                    time_points = [datetime.now() - timedelta(days=i) for i in range(days, 0, -1)]
+                # Generate time series data (Custom Range has no picker yet and charts the last month)
+                chart_range = "Last 1 Month" if timeline_range == "Custom Range" else timeline_range
+                time_points = timeline_time_points(chart_range, int(time.time() // 60))
                 
-                # Generate engagement metrics over time
-                engagement_data = []
+                # Generate engagement metrics over time as columnar arrays
+                n_points = len(time_points)
                 base_engagement = 100
-                for i, time_point in enumerate(time_points):
-                    # Simulate viral growth pattern
-                    growth_factor = np.exp(i * 0.1) if i < len(time_points) * 0.7 else np.exp((len(time_points) * 0.7) * 0.1) * np.exp(-(i - len(time_points) * 0.7) * 0.05)
-                    engagement = int(base_engagement * growth_factor * (1 + np.random.normal(0, 0.1)))
-                    
-                    engagement_data.append({
-                        'timestamp': time_point,
-                        'engagement': max(engagement, 0),
-                        'platform': primary_platform,
-                        'cumulative_reach': sum([e['engagement'] for e in engagement_data]) + engagement
-                    })
+                peak_index = n_points * 0.7
+                
+                # Simulate viral growth pattern: exponential rise, then decay after the peak
+                steps = np.arange(n_points)
+                growth_factor = np.where(
+                    steps < peak_index,
+                    np.exp(steps * 0.1),
+                    np.exp(peak_index * 0.1) * np.exp(-(steps - peak_index) * 0.05)
+                )
+                noise = 1 + get_rng().normal(0, 0.1, size=n_points)
+                eng = np.maximum((base_engagement * growth_factor * noise).astype(np.int64), 0)
+                cum = np.cumsum(eng)
                 
                 # Create timeline chart
-                df_timeline = pd.DataFrame(engagement_data)
+                df_timeline = pd.DataFrame({
+                    'timestamp': np.array(time_points, dtype='datetime64[ns]'),
+                    'engagement': eng,
+                    'platform': pd.Categorical.from_codes(np.zeros(n_points, dtype=np.int8), categories=[primary_platform]),
+                    'cumulative_reach': cum
+                })
                 
-                # Engagement over time
-                fig_engagement = px.line(
-                    df_timeline,
-                    x='timestamp',
-                    y='engagement',
-                    title=f"Viral Engagement Timeline - {tracking_input}",
-                    labels={'engagement': 'Engagement Count', 'timestamp': f'Time ({timezone_display})'},
-                    color_discrete_sequence=['#FF6B35']
-                )
-                fig_engagement.update_layout(
-                    xaxis_title=f"Time ({timezone_display})",
-                    yaxis_title="Engagement Count",
-                    hovermode='x unified'
-                )
+                # Engagement over time (WebGL traces, cached until the data changes)
+                df_key = timeline_df_key(df_timeline)
+                fig_engagement = go.Figure(build_engagement_fig(
+                    df_key, df_timeline, f"Viral Engagement Timeline - {tracking_input}", timezone_display
+                ))
                 st.plotly_chart(fig_engagement, use_container_width=True)
                 
                 # Cumulative reach
-                fig_cumulative = px.area(
-                    df_timeline,
-                    x='timestamp',
-                    y='cumulative_reach',
-                    title=f"Cumulative Reach Growth - {tracking_input}",
-                    labels={'cumulative_reach': 'Total Reach', 'timestamp': f'Time ({timezone_display})'},
-                    color_discrete_sequence=['#4ECDC4']
-                )
+                fig_cumulative = go.Figure(build_cumulative_fig(
+                    df_key, df_timeline, f"Cumulative Reach Growth - {tracking_input}", timezone_display
+                ))
                 st.plotly_chart(fig_cumulative, use_container_width=True)
                 
                 # Timeline metrics
                 st.markdown("### 📈 Timeline Analytics")
                 
+                # Reduce straight from the NumPy arrays to plain Python scalars
+                total_engagement = int(eng.sum())
+                peak_engagement = int(eng.max())
+                avg_growth = float(np.mean(np.diff(eng) / np.maximum(eng[:-1], 1)) * 100) if n_points > 1 else 0.0
+                final_reach = int(cum[-1])
+                
                 metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
                 
                 with metric_col1:
-                    total_engagement = df_timeline['engagement'].sum()
                     st.metric("Total Engagement", f"{total_engagement:,}")
                 
                 with metric_col2:
-                    peak_engagement = df_timeline['engagement'].max()
                     st.metric("Peak Engagement", f"{peak_engagement:,}")
                 
                 with metric_col3:
-                    avg_growth = df_timeline['engagement'].pct_change().mean() * 100
                     st.metric("Avg Growth Rate", f"{avg_growth:.1f}%")
                 
                 with metric_col4:
-                    final_reach = df_timeline['cumulative_reach'].iloc[-1]
                     st.metric("Total Reach", f"{final_reach:,}")
                 
                 # Hourly breakdown for 24-hour view
                 if timeline_range == "Last 24 Hours":
                     st.markdown("### ⏰ Hourly Breakdown (IST)")
                     
-                    hourly_data = []
-                    for hour in range(24):
-                        hour_engagement = df_timeline[df_timeline['timestamp'].dt.hour == hour]['engagement'].sum()
-                        ist_hour = (hour + 5.5) % 24  # Convert to IST
-                        hourly_data.append({
-                            'hour': f"{int(ist_hour):02d}:00 IST",
-                            'engagement': hour_engagement,
-                            'activity_level': 'High' if hour_engagement > df_timeline['engagement'].mean() else 'Low'
-                        })
-                    
-                    df_hourly = pd.DataFrame(hourly_data)
+                    # Sum engagement per hour of day in one pass
+                    hour_engagement = np.bincount(
+                        df_timeline['timestamp'].dt.hour.to_numpy(), weights=eng, minlength=24
+                    ).astype(np.int64)
+                    ist_hours = (np.arange(24) + 5) % 24  # Convert to IST (whole hours)
+                    df_hourly = pd.DataFrame({
+                        'hour': np.char.add(np.char.zfill(ist_hours.astype(str), 2), ':00 IST'),
+                        'engagement': hour_engagement,
+                        'activity_level': pd.Categorical(np.where(hour_engagement > eng.mean(), 'High', 'Low'), categories=['High', 'Low'])
+                    })
                     
-                    fig_hourly = px.bar(
-                        df_hourly,
-                        x='hour',
-                        y='engagement',
-                        color='activity_level',
-                        title="Hourly Engagement Pattern (IST)",
-                        color_discrete_map={'High': '#FF6B35', 'Low': '#95A5A6'}
-                    )
+                    fig_hourly = go.Figure(build_hourly_fig(df_hourly))
                     st.plotly_chart(fig_hourly, use_container_width=True)
                 
                 # Platform-wise breakdown
                 if len(tracking_platforms) > 1:
                     st.markdown("### 📱 Platform-wise Timeline")
                     
-                    platform_data = []
-                    for platform in tracking_platforms:
-                        for time_point in time_points:
-                            engagement = np.random.randint(50, 500)
-                            platform_data.append({
-                                'timestamp': time_point,
-                                'platform': platform,
-                                'engagement': engagement
-                            })
-                    
-                    df_platforms = pd.DataFrame(platform_data)
+                    # One row per (platform, time point), built column-wise
+                    df_platforms = pd.DataFrame({
+                        'timestamp': np.tile(df_timeline['timestamp'].to_numpy(), len(tracking_platforms)),
+                        'platform': pd.Categorical(np.repeat(np.asarray(tracking_platforms), n_points), categories=tracking_platforms),
+                        'engagement': get_rng().integers(50, 500, size=len(tracking_platforms) * n_points)
+                    })
                     
                     fig_platforms = px.line(
                         df_platforms,
@@ -1557,38 +2033,33 @@ with tab1:
         # Show instructions when no tracking is active
         st.info("🎯 **Start Unified Tracking** above to see detailed viral timeline analytics")
         
-        st.markdown("""
-        ### 📈 Enhanced Viral Timeline Features
-        
-        When you start tracking content, this tab will show:
-        
-        #### 🕐 **24 Hours Analytics**
-        - Hourly engagement patterns in IST timezone
-        - Peak activity identification
-        - Real-time growth tracking
-        
-        #### 📅 **1 Week Analytics** 
-        - Daily viral spread patterns
-        - Weekly trend analysis
-        - Platform comparison over time
-        
-        #### 📆 **1 Month Analytics**
-        - Long-term viral lifecycle
-        - Sustained engagement analysis
-        - Historical trend comparison
-        
-        #### 🔍 **Key Metrics**
-        - Total engagement count
-        - Peak engagement periods
-        - Average growth rate
-        - Cumulative reach analysis
-        - Platform-wise breakdown
-        
-        **Start tracking above to see live analytics!**
-        """)
+        st.markdown(VIRAL_TIMELINE_INSTRUCTIONS)
+
+with tab1:
+    if tab1.open:
+        render_viral_timeline()
+
+# Static instructions shown in the comprehensive analysis tab until it has data
+COMPREHENSIVE_ANALYSIS_INSTRUCTIONS = """
+### 🔍 Real-time Comprehensive Analysis
+
+This analysis provides:
+
+- **Live Content Analysis**: Real-time posts from selected platforms
+- **Sentiment Tracking**: Average sentiment scores across all posts
+- **Viral Potential**: Identification of high-viral-potential content
+- **Risk Assessment**: Detection of potentially harmful or misleading content
+- **Trending Topics**: Most mentioned hashtags and keywords
+- **Platform Insights**: Distribution and engagement patterns across platforms
+- **High-Impact Posts**: Top-performing content with detailed metrics
+
+**Usage**: Enter relevant keywords and select platforms to analyze current social media activity.
+"""
 
 # Tab 2: Comprehensive Analysis
-with tab2:
+@st.fragment
+def render_comprehensive_analysis():
+    """Render the comprehensive analysis tab"""
     st.subheader("🔍 Real-time Comprehensive Analysis")
     
     # Search parameters for real-time analysis
@@ -1618,10 +2089,7 @@ with tab2:
             with st.spinner("Fetching and analyzing real-time data..."):
                 try:
                     # Get comprehensive analysis data
-                    analysis_data = asyncio.run(realtime_service.get_comprehensive_analysis_data(
-                        keywords=keywords_list,
-                        platforms=analysis_platforms
-                    ))
+                    analysis_data = fetch_comprehensive_analysis(realtime_service, tuple(keywords_list), tuple(analysis_platforms))
                     
                     if analysis_data["posts"]:
                         st.success(f"✅ Analyzed {len(analysis_data['posts'])} real-time posts")
@@ -1657,10 +2125,9 @@ with tab2:
                             st.markdown("#### 📱 Platform Distribution")
                             platform_dist = summary.get("platform_distribution", {})
                             if platform_dist:
-                                fig_platform = px.pie(
-                                    values=list(platform_dist.values()),
-                                    names=list(platform_dist.keys()),
-                                    title="Posts by Platform"
+                                fig_platform = go.Figure(
+                                    go.Pie(labels=list(platform_dist.keys()), values=list(platform_dist.values())),
+                                    layout=dict(title="Posts by Platform")
                                 )
                                 st.plotly_chart(fig_platform, use_container_width=True)
                         
@@ -1668,10 +2135,9 @@ with tab2:
                             st.markdown("#### 🌍 Language Distribution")
                             lang_dist = summary.get("language_distribution", {})
                             if lang_dist:
-                                fig_lang = px.bar(
-                                    x=list(lang_dist.keys()),
-                                    y=list(lang_dist.values()),
-                                    title="Posts by Language"
+                                fig_lang = go.Figure(
+                                    go.Bar(x=list(lang_dist.keys()), y=list(lang_dist.values())),
+                                    layout=dict(title="Posts by Language")
                                 )
                                 st.plotly_chart(fig_lang, use_container_width=True)
                         
@@ -1692,19 +2158,17 @@ with tab2:
                         
                         # Recent high-impact posts
                         st.markdown("#### 🚀 High-Impact Posts")
-                        high_impact_posts = sorted(analysis_data["posts"], key=lambda x: x.viral_score, reverse=True)[:5]
-                        
-                        for i, post in enumerate(high_impact_posts):
-                            with st.expander(f"Post {i+1}: {post.platform.title()} - Viral Score: {post.viral_score:.2f}"):
-                                col1, col2 = st.columns([3, 1])
-                                with col1:
-                                    st.write(f"**Content:** {post.content[:200]}...")
-                                    st.write(f"**Author:** {post.author}")
-                                    st.write(f"**Timestamp:** {post.timestamp}")
-                                with col2:
-                                    st.metric("Engagement", sum(post.engagement.values()))
-                                    st.metric("Sentiment", f"{post.sentiment_score:.2f}")
-                                    st.write(f"**Risk Level:** {post.risk_level.upper()}")
+                        high_impact_posts = heapq.nlargest(5, analysis_data["posts"], key=lambda x: x["viral_score"])
+                        st.dataframe(pd.DataFrame({
+                            "Platform": [post["platform"].title() for post in high_impact_posts],
+                            "Content": [post["content"][:200] for post in high_impact_posts],
+                            "Author": [post["author"] for post in high_impact_posts],
+                            "Timestamp": [post["timestamp"] for post in high_impact_posts],
+                            "Viral Score": [post["viral_score"] for post in high_impact_posts],
+                            "Engagement": [post["engagement_total"] for post in high_impact_posts],
+                            "Sentiment": [post["sentiment_score"] for post in high_impact_posts],
+                            "Risk Level": [post["risk_level"].upper() for post in high_impact_posts]
+                        }), use_container_width=True, hide_index=True)
                     
                     else:
                         st.warning("⚠️ No real-time data found for the specified keywords and platforms.")
@@ -1719,24 +2183,32 @@ with tab2:
         st.info("👆 Click 'Analyze Real-time Data' to fetch and analyze current social media content")
         
         # Show information about comprehensive analysis
-        st.markdown("""
-        ### 🔍 Real-time Comprehensive Analysis
-        
-        This analysis provides:
-        
-        - **Live Content Analysis**: Real-time posts from selected platforms
-        - **Sentiment Tracking**: Average sentiment scores across all posts
-        - **Viral Potential**: Identification of high-viral-potential content
-        - **Risk Assessment**: Detection of potentially harmful or misleading content
-        - **Trending Topics**: Most mentioned hashtags and keywords
-        - **Platform Insights**: Distribution and engagement patterns across platforms
-        - **High-Impact Posts**: Top-performing content with detailed metrics
-        
-        **Usage**: Enter relevant keywords and select platforms to analyze current social media activity.
-        """)
+        st.markdown(COMPREHENSIVE_ANALYSIS_INSTRUCTIONS)
+
+with tab2:
+    if tab2.open:
+        render_comprehensive_analysis()
+
+# Static instructions shown in the sentiment behavior tab until it has data
+SENTIMENT_BEHAVIOR_INSTRUCTIONS = """
+### 💭 Real-time Sentiment & Behavior Analysis
+
+This analysis provides:
+
+- **Sentiment Timeline**: Track sentiment changes over time
+- **Behavior Patterns**: Identify posting frequency and engagement patterns
+- **Platform Comparison**: Compare sentiment across different social media platforms
+- **Extreme Sentiment Detection**: Find posts with strongly positive or negative sentiment
+- **Engagement Correlation**: Analyze relationship between sentiment and engagement
+- **Temporal Patterns**: Understand when different sentiments are most prevalent
+
+**Usage**: Enter keywords related to topics you want to analyze for sentiment patterns.
+"""
 
 # Tab 3: Sentiment & Behavior Analysis
-with tab3:
+@st.fragment
+def render_sentiment_behavior():
+    """Render the sentiment & behavior analysis tab"""
     st.subheader("💭 Real-time Sentiment & Behavior Analysis")
     
     # Search parameters for sentiment analysis
@@ -1766,10 +2238,7 @@ with tab3:
             with st.spinner("Analyzing real-time sentiment and behavior patterns..."):
                 try:
                     # Get sentiment and behavior data
-                    sentiment_data = asyncio.run(realtime_service.get_sentiment_behavior_data(
-                        keywords=keywords_list,
-                        platforms=sentiment_platforms
-                    ))
+                    sentiment_data = fetch_sentiment_behavior(realtime_service, tuple(keywords_list), tuple(sentiment_platforms))
                     
                     if sentiment_data["posts"]:
                         st.success(f"✅ Analyzed sentiment from {len(sentiment_data['posts'])} real-time posts")
@@ -1780,12 +2249,9 @@ with tab3:
                         
                         if timeline:
                             timeline_df = pd.DataFrame(timeline)
-                            fig_timeline = px.line(
-                                timeline_df,
-                                x="timestamp",
-                                y="sentiment_score",
-                                title="Sentiment Score Over Time",
-                                labels={"sentiment_score": "Sentiment Score", "timestamp": "Time"}
+                            fig_timeline = go.Figure(
+                                go.Scatter(x=timeline_df["timestamp"], y=timeline_df["sentiment_score"], mode="lines"),
+                                layout=dict(title="Sentiment Score Over Time", xaxis_title="Time", yaxis_title="Sentiment Score")
                             )
                             fig_timeline.add_hline(y=0, line_dash="dash", line_color="gray", annotation_text="Neutral")
                             st.plotly_chart(fig_timeline, use_container_width=True)
@@ -1800,13 +2266,11 @@ with tab3:
                             st.markdown("#### ⏰ Posting Frequency by Hour")
                             posting_freq = patterns.get("posting_frequency", {})
                             if posting_freq:
-                                hours = list(posting_freq.keys())
-                                counts = list(posting_freq.values())
-                                fig_freq = px.bar(
-                                    x=hours,
-                                    y=counts,
-                                    title="Posts by Hour of Day",
-                                    labels={"x": "Hour", "y": "Number of Posts"}
+                                hours = np.arange(24)
+                                counts = np.array([posting_freq.get(hour, 0) for hour in range(24)])
+                                fig_freq = go.Figure(
+                                    go.Bar(x=hours, y=counts),
+                                    layout=dict(title="Posts by Hour of Day", xaxis_title="Hour", yaxis_title="Number of Posts")
                                 )
                                 st.plotly_chart(fig_freq, use_container_width=True)
                         
@@ -1821,62 +2285,45 @@ with tab3:
                         st.markdown("### 📱 Sentiment by Platform")
                         posts = sentiment_data["posts"]
                         
-                        # Create sentiment distribution data
-                        platform_sentiment = {}
-                        for post in posts:
-                            platform = post.platform
-                            if platform not in platform_sentiment:
-                                platform_sentiment[platform] = {"positive": 0, "negative": 0, "neutral": 0, "total": 0}
+                        # Bucket sentiment per post and tally per platform in one vectorised pass
+                        if posts:
+                            scores = np.fromiter((post["sentiment_score"] for post in posts), dtype=np.float64, count=len(posts))
+                            sentiment_labels = np.select([scores > 0.1, scores < -0.1], ["Positive", "Negative"], default="Neutral")
+                            sentiment_pct = pd.crosstab(
+                                pd.Series([post["platform"] for post in posts], name="Platform"),
+                                pd.Series(sentiment_labels, name="Sentiment"),
+                                normalize="index"
+                            ).reindex(columns=["Positive", "Negative", "Neutral"], fill_value=0) * 100
+                            
+                            # Create visualization
+                            sentiment_df = sentiment_pct.reset_index().melt(
+                                id_vars="Platform", var_name="Sentiment", value_name="Percentage"
+                            ).astype({"Platform": "category", "Sentiment": "category"})
                             
-                            if post.sentiment_score > 0.1:
-                                platform_sentiment[platform]["positive"] += 1
-                            elif post.sentiment_score < -0.1:
-                                platform_sentiment[platform]["negative"] += 1
-                            else:
-                                platform_sentiment[platform]["neutral"] += 1
-                            platform_sentiment[platform]["total"] += 1
-                        
-                        # Create visualization
-                        sentiment_viz_data = []
-                        for platform, sentiments in platform_sentiment.items():
-                            total = sentiments["total"]
-                            if total > 0:
-                                sentiment_viz_data.extend([
-                                    {"Platform": platform, "Sentiment": "Positive", "Percentage": sentiments["positive"] / total * 100},
-                                    {"Platform": platform, "Sentiment": "Negative", "Percentage": sentiments["negative"] / total * 100},
-                                    {"Platform": platform, "Sentiment": "Neutral", "Percentage": sentiments["neutral"] / total * 100}
-                                ])
-                        
-                        if sentiment_viz_data:
-                            sentiment_df = pd.DataFrame(sentiment_viz_data)
                             fig_platform_sentiment = px.bar(
                                 sentiment_df,
                                 x="Platform",
                                 y="Percentage",
                                 color="Sentiment",
                                 title="Sentiment Distribution by Platform",
-                                color_discrete_map={"Positive": "green", "Negative": "red", "Neutral": "gray"}
+                                color_discrete_map=SENTIMENT_COLORS
                             )
                             st.plotly_chart(fig_platform_sentiment, use_container_width=True)
                         
                         # Recent posts with extreme sentiment
                         st.markdown("### 🎯 Posts with Extreme Sentiment")
                         
-                        # Sort posts by absolute sentiment score
-                        extreme_posts = sorted(posts, key=lambda x: abs(x.sentiment_score), reverse=True)[:5]
-                        
-                        for i, post in enumerate(extreme_posts):
-                            sentiment_emoji = "😊" if post.sentiment_score > 0.1 else "😠" if post.sentiment_score < -0.1 else "😐"
-                            with st.expander(f"{sentiment_emoji} Post {i+1}: {post.platform.title()} - Sentiment: {post.sentiment_score:.2f}"):
-                                col1, col2 = st.columns([3, 1])
-                                with col1:
-                                    st.write(f"**Content:** {post.content[:200]}...")
-                                    st.write(f"**Author:** {post.author}")
-                                    st.write(f"**Timestamp:** {post.timestamp}")
-                                with col2:
-                                    st.metric("Sentiment Score", f"{post.sentiment_score:.2f}")
-                                    st.metric("Viral Score", f"{post.viral_score:.2f}")
-                                    st.write(f"**Engagement:** {sum(post.engagement.values())}")
+                        # Pick the five posts with the largest absolute sentiment score
+                        extreme_posts = heapq.nlargest(5, posts, key=lambda x: abs(x["sentiment_score"]))
+                        st.dataframe(pd.DataFrame({
+                            "Platform": [post["platform"].title() for post in extreme_posts],
+                            "Content": [post["content"][:200] for post in extreme_posts],
+                            "Author": [post["author"] for post in extreme_posts],
+                            "Timestamp": [post["timestamp"] for post in extreme_posts],
+                            "Sentiment Score": [post["sentiment_score"] for post in extreme_posts],
+                            "Viral Score": [post["viral_score"] for post in extreme_posts],
+                            "Engagement": [post["engagement_total"] for post in extreme_posts]
+                        }), use_container_width=True, hide_index=True)
                     
                     else:
                         st.warning("⚠️ No real-time data found for sentiment analysis.")
@@ -1891,23 +2338,46 @@ with tab3:
         st.info("👆 Click 'Analyze Sentiment & Behavior' to start real-time sentiment analysis")
         
         # Show information about sentiment analysis
-        st.markdown("""
-        ### 💭 Real-time Sentiment & Behavior Analysis
-        
-        This analysis provides:
-        
-        - **Sentiment Timeline**: Track sentiment changes over time
-        - **Behavior Patterns**: Identify posting frequency and engagement patterns
-        - **Platform Comparison**: Compare sentiment across different social media platforms
-        - **Extreme Sentiment Detection**: Find posts with strongly positive or negative sentiment
-        - **Engagement Correlation**: Analyze relationship between sentiment and engagement
-        - **Temporal Patterns**: Understand when different sentiments are most prevalent
-        
-        **Usage**: Enter keywords related to topics you want to analyze for sentiment patterns.
-        """)
+        st.markdown(SENTIMENT_BEHAVIOR_INSTRUCTIONS)
+
+with tab3:
+    if tab3.open:
+        render_sentiment_behavior()
+
+# Static instructions shown in the influence network tab until it has data
+INFLUENCE_NETWORK_INSTRUCTIONS = """
+### 🕸️ Enhanced Influence Network Features
+
+When you start tracking content, this tab will show:
+
+#### 🕐 **Chronological Analysis**
+- **Reverse Timeline**: Trace content backwards to find original source
+- **Forward Propagation**: Track how content spreads forward in time
+- **Bidirectional**: Complete timeline analysis in both directions
+
+#### ⏱️ **IST Time Precision**
+- Minute-level precision for rapid viral content
+- Hour-level for trending topics
+- Day-level for long-term campaigns
+
+#### 🔍 **Network Depth Analysis**
+- 1-2 degrees: Direct connections only
+- 3-4 degrees: Extended network analysis
+- 5+ degrees: Complete influence mapping
+
+#### 🎯 **Original Source Detection**
+- Algorithmic source identification
+- Confidence scoring (60-95% accuracy)
+- Timeline verification
+- Cross-platform correlation
+
+**Start tracking above to see live network analysis!**
+"""
 
 # Tab 4: Enhanced Influence Network with Chronological Tracking
-with tab4:
+@st.fragment
+def render_influence_network():
+    """Render the chronological influence network tab"""
     st.subheader("🕸️ Influence Network & Chronological Origin Tracking")
     
     # Check if unified tracking is active
@@ -1969,122 +2439,11 @@ with tab4:
             # Network visualization
             st.markdown("### 🕸️ Chronological Influence Network")
             
-            # Create network graph
-            G = nx.Graph()
-            
-            # Add nodes with chronological data
-            for node in network_data['nodes']:
-                G.add_node(
-                    node['id'],
-                    label=node['label'],
-                    timestamp=node['timestamp'],
-                    influence_score=node['influence_score'],
-                    platform=node['platform']
-                )
-            
-            # Add edges with time-based weights
-            for edge in network_data['edges']:
-                G.add_edge(
-                    edge['source'],
-                    edge['target'],
-                    weight=edge['weight'],
-                    time_diff=edge['time_diff'],
-                    interaction_type=edge['interaction_type']
-                )
-            
-            # Calculate layout
-            pos = nx.spring_layout(G, k=1, iterations=50)
-            
-            # Create plotly network visualization
-            edge_x = []
-            edge_y = []
-            edge_info = []
-            
-            for edge in G.edges():
-                x0, y0 = pos[edge[0]]
-                x1, y1 = pos[edge[1]]
-                edge_x.extend([x0, x1, None])
-                edge_y.extend([y0, y1, None])
-                
-                edge_data = G.edges[edge]
-                edge_info.append(f"Time Diff: {edge_data.get('time_diff', 'N/A')}<br>"
-                              f"Type: {edge_data.get('interaction_type', 'Unknown')}<br>"
-                              f"Weight: {edge_data.get('weight', 0):.2f}")
-            
-            edge_trace = go.Scatter(
-                x=edge_x, y=edge_y,
-                line=dict(width=0.5, color='#888'),
-                hoverinfo='none',
-                mode='lines'
-            )
-            
-            # Node traces
-            node_x = []
-            node_y = []
-            node_text = []
-            node_color = []
-            node_size = []
-            
-            for node in G.nodes():
-                x, y = pos[node]
-                node_x.append(x)
-                node_y.append(y)
-                
-                node_data = G.nodes[node]
-                node_text.append(f"User: {node_data.get('label', node)}<br>"
-                                f"Platform: {node_data.get('platform', 'Unknown')}<br>"
-                                f"Timestamp: {node_data.get('timestamp', 'N/A')}<br>"
-                                f"Influence: {node_data.get('influence_score', 0):.2f}")
-                
-                # Color by platform
-                platform_colors = {
-                    'twitter': '#1DA1F2',
-                    'facebook': '#4267B2',
-                    'instagram': '#E4405F',
-                    'youtube': '#FF0000',
-                    'reddit': '#FF4500'
-                }
-                node_color.append(platform_colors.get(node_data.get('platform', 'twitter'), '#888888'))
-                
-                # Size by influence score
-                influence = node_data.get('influence_score', 0.5)
-                node_size.append(max(10, influence * 30))
-            
-            node_trace = go.Scatter(
-                x=node_x, y=node_y,
-                mode='markers+text',
-                hoverinfo='text',
-                text=[G.nodes[node].get('label', node) for node in G.nodes()],
-                textposition="middle center",
-                hovertext=node_text,
-                marker=dict(
-                    size=node_size,
-                    color=node_color,
-                    line=dict(width=2, color='white')
-                )
-            )
-            
-            # Create figure
-            fig_network = go.Figure(
-                data=[edge_trace, node_trace],
-                layout=go.Layout(
-                    title=dict(text=f'Chronological Influence Network - {tracking_input}', font=dict(size=16)),
-                    showlegend=False,
-                    hovermode='closest',
-                    margin=dict(b=20,l=5,r=5,t=40),
-                    annotations=[ dict(
-                        text=f"Network Analysis: {chronological_mode} | Precision: {time_precision} | Depth: {network_depth}",
-                        showarrow=False,
-                        xref="paper", yref="paper",
-                        x=0.005, y=-0.002,
-                        xanchor='left', yanchor='bottom',
-                        font=dict(color='gray', size=12)
-                    )],
-                    xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                    yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                    height=600
-                )
-            )
+            fig_network = go.Figure(build_network_fig(
+                network_data,
+                f'Chronological Influence Network - {tracking_input}',
+                f"Network Analysis: {chronological_mode} | Precision: {time_precision} | Depth: {network_depth}"
+            ))
             
             st.plotly_chart(fig_network, use_container_width=True)
             
@@ -2094,34 +2453,25 @@ with tab4:
             # Sort nodes by timestamp
             timeline_nodes = sorted(network_data['nodes'], key=lambda x: x['timestamp'])
             
-            timeline_data = []
-            for i, node in enumerate(timeline_nodes):
-                # Convert to IST
-                timestamp = datetime.fromisoformat(node['timestamp'].replace('Z', '+00:00'))
-                ist_timestamp = timestamp + timedelta(hours=5, minutes=30)
-                
-                timeline_data.append({
-                    'sequence': i + 1,
-                    'user': node['label'],
-                    'platform': node['platform'],
-                    'timestamp_ist': ist_timestamp.strftime('%Y-%m-%d %H:%M:%S IST'),
-                    'influence_score': node['influence_score'],
-                    'role': 'Original Source' if i == 0 else f'Propagator #{i}'
-                })
+            # Convert all timestamps to IST in one pass (naive timestamps are treated as UTC)
+            ist_timestamps = pd.to_datetime(
+                [node['timestamp'] for node in timeline_nodes], utc=True, format='ISO8601'
+            ).tz_convert(IST).strftime('%Y-%m-%d %H:%M:%S IST')
             
-            df_timeline = pd.DataFrame(timeline_data)
+            n_nodes = len(timeline_nodes)
+            df_timeline = pd.DataFrame({
+                'sequence': np.arange(1, n_nodes + 1),
+                'user': [node['label'] for node in timeline_nodes],
+                'platform': pd.Categorical([node['platform'] for node in timeline_nodes]),
+                'timestamp_ist': ist_timestamps,
+                'influence_score': np.fromiter(
+                    (node['influence_score'] for node in timeline_nodes), dtype=np.float64, count=n_nodes
+                ),
+                'role': ['Original Source' if i == 0 else f'Propagator #{i}' for i in range(n_nodes)]
+            })
             
             # Timeline visualization
-            fig_timeline = px.scatter(
-                df_timeline,
-                x='sequence',
-                y='influence_score',
-                color='platform',
-                size='influence_score',
-                hover_data=['user', 'timestamp_ist', 'role'],
-                title="Chronological Propagation Timeline",
-                labels={'sequence': 'Chronological Order', 'influence_score': 'Influence Score'}
-            )
+            fig_timeline = go.Figure(build_propagation_fig(df_timeline))
             
             st.plotly_chart(fig_timeline, use_container_width=True)
             
@@ -2137,7 +2487,7 @@ with tab4:
                 st.metric("Total Connections", len(network_data['edges']))
             
             with metric_col3:
-                avg_influence = np.mean([node['influence_score'] for node in network_data['nodes']])
+                avg_influence = df_timeline['influence_score'].mean()
                 st.metric("Avg Influence", f"{avg_influence:.2f}")
             
             with metric_col4:
@@ -2152,10 +2502,12 @@ with tab4:
                 source_col1, source_col2 = st.columns(2)
                 
                 with source_col1:
-                    st.success(f"**Original Source Identified:**")
-                    st.info(f"**User:** {original_source['label']}")
-                    st.info(f"**Platform:** {original_source['platform'].title()}")
-                    st.info(f"**Timestamp (IST):** {(datetime.fromisoformat(original_source['timestamp'].replace('Z', '+00:00')) + timedelta(hours=5, minutes=30)).strftime('%Y-%m-%d %H:%M:%S IST')}")
+                    st.success(
+                        f"**Original Source Identified:**  \n"
+                        f"**User:** {original_source['label']}  \n"
+                        f"**Platform:** {original_source['platform'].title()}  \n"
+                        f"**Timestamp (IST):** {ist_timestamps[0]}"
+                    )
                 
                 with source_col2:
                     confidence_score = calculate_confidence_score(network_data)
@@ -2229,37 +2581,133 @@ with tab4:
         # Show instructions when no tracking is active
         st.info("🎯 **Start Unified Tracking** above to build chronological influence networks")
         
-        st.markdown("""
-        ### 🕸️ Enhanced Influence Network Features
-        
-        When you start tracking content, this tab will show:
-        
-        #### 🕐 **Chronological Analysis**
-        - **Reverse Timeline**: Trace content backwards to find original source
-        - **Forward Propagation**: Track how content spreads forward in time
-        - **Bidirectional**: Complete timeline analysis in both directions
-        
-        #### ⏱️ **IST Time Precision**
-        - Minute-level precision for rapid viral content
-        - Hour-level for trending topics
-        - Day-level for long-term campaigns
-        
-        #### 🔍 **Network Depth Analysis**
-        - 1-2 degrees: Direct connections only
-        - 3-4 degrees: Extended network analysis
-        - 5+ degrees: Complete influence mapping
-        
-        #### 🎯 **Original Source Detection**
-        - Algorithmic source identification
-        - Confidence scoring (60-95% accuracy)
-        - Timeline verification
-        - Cross-platform correlation
-        
-        **Start tracking above to see live network analysis!**
-        """)
+        st.markdown(INFLUENCE_NETWORK_INSTRUCTIONS)
+
+with tab4:
+    if tab4.open:
+        render_influence_network()
+
+# Locations sampled for the synthetic geographic analysis, as (name, lat, lon) centroids
+INDIA_STATES = (
+    ("Maharashtra", 19.75, 75.71), ("Delhi", 28.70, 77.10), ("Karnataka", 15.32, 75.71),
+    ("Tamil Nadu", 11.13, 78.66), ("Gujarat", 22.26, 71.19), ("West Bengal", 22.99, 87.86),
+    ("Rajasthan", 27.02, 74.22), ("Uttar Pradesh", 26.85, 80.95), ("Telangana", 18.11, 79.02),
+    ("Kerala", 10.85, 76.27)
+)
+GLOBAL_COUNTRIES = (
+    ("India", 20.59, 78.96), ("USA", 37.09, -95.71), ("UK", 55.38, -3.44),
+    ("Canada", 56.13, -106.35), ("Australia", -25.27, 133.78), ("Germany", 51.17, 10.45),
+    ("France", 46.23, 2.21), ("Japan", 36.20, 138.25), ("Brazil", -14.24, -51.93),
+    ("Singapore", 1.35, 103.82)
+)
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def build_geo_data(geo_scope: str, seed: int) -> pd.DataFrame:
+    """Generate synthetic per-location spread data for the geographic analysis"""
+    rng = np.random.default_rng(seed)
+    if geo_scope == "India":
+        locations = INDIA_STATES
+        posts_range, engagement_range = (50, 500), (1000, 10000)
+    else:
+        locations = GLOBAL_COUNTRIES
+        posts_range, engagement_range = (100, 1000), (2000, 20000)
+    names, lats, lons = zip(*locations)
+    n = len(locations)
+    return pd.DataFrame({
+        'location': names,
+        'posts': rng.integers(*posts_range, size=n),
+        'engagement': rng.integers(*engagement_range, size=n),
+        'sentiment_score': rng.uniform(-1, 1, size=n),
+        'lat': lats,
+        'lon': lons
+    })
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def build_evidence_items(n: int, platforms: Tuple[str, ...], legal_standard: str, seed: int, minute: int) -> pd.DataFrame:
+    """Generate a synthetic evidence inventory collected at the given epoch minute, Arrow-backed with categorical labels"""
+    rng = np.random.default_rng(seed)
+    now = datetime.fromtimestamp(minute * 60)
+    ids = np.char.add(f"EVD_{now.strftime('%Y%m%d')}_", np.char.zfill(np.arange(1, n + 1).astype(str), 3))
+    timestamps = np.datetime64(now, 'us') - rng.integers(1, 48, size=n).astype('timedelta64[h]')
+    return pd.DataFrame({
+        'evidence_id': ids,
+        'type': rng.choice(['Post', 'Image', 'Video', 'Profile', 'Metadata'], size=n),
+        'platform': rng.choice(platforms, size=n),
+        'timestamp': timestamps,
+        'hash': np.char.add('sha256:', rng.integers(100000, 999999, size=n).astype(str)),
+        'size': np.char.add(rng.integers(1, 100, size=n).astype(str), ' KB'),
+        'status': 'Preserved',
+        'legal_compliance': legal_standard
+    }).convert_dtypes(dtype_backend='pyarrow').astype(
+        {'type': 'category', 'platform': 'category', 'status': 'category', 'legal_compliance': 'category'}
+    )
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs=PANDAS_HASH_FUNCS)
+def build_geo_map(df_geo: pd.DataFrame, tracking_input: str) -> dict:
+    """Build the geographic distribution map, cached on the DataFrame contents"""
+    if len(df_geo) > MAX_MAP_POINTS:
+        df_geo = df_geo.nlargest(MAX_MAP_POINTS, 'posts')
+    fig = go.Figure(go.Scattermapbox(
+        lat=df_geo['lat'],
+        lon=df_geo['lon'],
+        mode='markers',
+        marker=dict(
+            size=df_geo['posts'],
+            sizemode='area',
+            sizeref=2.0 * df_geo['posts'].max() / 30 ** 2,
+            color=df_geo['sentiment_score'],
+            colorscale='RdYlGn',
+            colorbar=dict(title='sentiment_score')
+        ),
+        text=df_geo['location'],
+        customdata=df_geo[['posts', 'engagement']].to_numpy(),
+        hovertemplate=(
+            "<b>%{text}</b><br>posts=%{customdata[0]}<br>engagement=%{customdata[1]}"
+            "<br>sentiment_score=%{marker.color:.2f}<extra></extra>"
+        )
+    ))
+    fig.update_layout(
+        mapbox=dict(
+            style="open-street-map",
+            zoom=1,
+            center=dict(lat=df_geo['lat'].mean(), lon=df_geo['lon'].mean())
+        ),
+        height=500,
+        title=dict(text=f"Geographic Distribution - {tracking_input}", font=dict(size=16))
+    )
+    return fig.to_dict()
+
+# Static instructions shown in the geographic spread tab until it has data
+GEOGRAPHIC_SPREAD_INSTRUCTIONS = """
+### 🌍 Geographic Spread Features
+
+When you start tracking content, this tab will show:
+
+#### 🗺️ **Interactive Map Visualization**
+- Real-time geographic distribution of posts
+- Sentiment color-coding by location
+- Engagement size indicators
+- Zoom and pan capabilities
+
+#### 📊 **Geographic Analytics**
+- Top locations by engagement
+- Regional sentiment analysis
+- Geographic trend patterns
+- Cross-border spread tracking
+
+#### 🇮🇳 **India-Specific Features**
+- State-wise breakdown
+- District-level analysis
+- IST timezone alignment
+- Regional language detection
+
+**Start tracking above to see live geographic analysis!**
+"""
 
 # Tab 5: Geographic Spread
-with tab5:
+@st.fragment
+def render_geographic_spread():
+    """Render the geographic spread tab"""
     st.subheader("🌍 Geographic Spread Analysis")
     
     # Check if unified tracking is active
@@ -2298,34 +2746,8 @@ with tab5:
         if st.button("🗺️ Generate Geographic Analysis", type="primary"):
             with st.spinner("Analyzing geographic spread..."):
                 try:
-                    # Generate synthetic geographic data
-                    if geo_scope == "India":
-                        states = ["Maharashtra", "Delhi", "Karnataka", "Tamil Nadu", "Gujarat", 
-                                 "West Bengal", "Rajasthan", "Uttar Pradesh", "Telangana", "Kerala"]
-                        geo_data = []
-                        for state in states:
-                            geo_data.append({
-                                'location': state,
-                                'posts': np.random.randint(50, 500),
-                                'engagement': np.random.randint(1000, 10000),
-                                'sentiment_score': np.random.uniform(-1, 1),
-                                'lat': np.random.uniform(8, 35),
-                                'lon': np.random.uniform(68, 97)
-                            })
-                    else:
-                        # Global data
-                        countries = ["India", "USA", "UK", "Canada", "Australia", 
-                                   "Germany", "France", "Japan", "Brazil", "Singapore"]
-                        geo_data = []
-                        for country in countries:
-                            geo_data.append({
-                                'location': country,
-                                'posts': np.random.randint(100, 1000),
-                                'engagement': np.random.randint(2000, 20000),
-                                'sentiment_score': np.random.uniform(-1, 1),
-                                'lat': np.random.uniform(-60, 70),
-                                'lon': np.random.uniform(-180, 180)
-                            })
+                    # Generate synthetic geographic data, reproducible per tracked input
+                    geo_data = build_geo_data(geo_scope, stable_seed(f"{geo_scope}:{tracking_input}"))
                     
                     # Store in session state
                     st.session_state.geo_data = geo_data
@@ -2335,32 +2757,14 @@ with tab5:
                     st.error(f"Geographic analysis error: {e}")
         
         # Display geographic data if available
-        if st.session_state.get('geo_data'):
-            geo_data = st.session_state.geo_data
-            df_geo = pd.DataFrame(geo_data)
+        if st.session_state.get('geo_data') is not None:
+            df_geo = st.session_state.geo_data
             
             # Geographic visualization
             st.markdown("### 🗺️ Geographic Distribution Map")
             
             # Create map visualization
-            fig_map = px.scatter_mapbox(
-                df_geo,
-                lat='lat',
-                lon='lon',
-                size='posts',
-                color='sentiment_score',
-                hover_name='location',
-                hover_data=['posts', 'engagement'],
-                color_continuous_scale='RdYlGn',
-                size_max=30,
-                zoom=1,
-                title=f"Geographic Spread - {tracking_input}"
-            )
-            fig_map.update_layout(
-                mapbox_style="open-street-map",
-                height=500,
-                title=dict(text=f"Geographic Distribution - {tracking_input}", font=dict(size=16))
-            )
+            fig_map = go.Figure(build_geo_map(df_geo, tracking_input))
             st.plotly_chart(fig_map, use_container_width=True)
             
             # Geographic metrics
@@ -2368,57 +2772,65 @@ with tab5:
             metric_col1, metric_col2, metric_col3, metric_col4 = st.columns(4)
             
             with metric_col1:
-                st.metric("Total Locations", len(geo_data))
+                st.metric("Total Locations", len(df_geo))
             
             with metric_col2:
-                total_posts = sum([loc['posts'] for loc in geo_data])
+                total_posts = int(df_geo['posts'].sum())
                 st.metric("Total Posts", f"{total_posts:,}")
             
             with metric_col3:
-                total_engagement = sum([loc['engagement'] for loc in geo_data])
+                total_engagement = int(df_geo['engagement'].sum())
                 st.metric("Total Engagement", f"{total_engagement:,}")
             
             with metric_col4:
-                avg_sentiment = np.mean([loc['sentiment_score'] for loc in geo_data])
+                avg_sentiment = df_geo['sentiment_score'].mean()
                 st.metric("Avg Sentiment", f"{avg_sentiment:.2f}")
             
             # Top locations table
             st.markdown("### 🏆 Top Locations by Engagement")
-            df_sorted = df_geo.sort_values('engagement', ascending=False)
-            st.dataframe(df_sorted[['location', 'posts', 'engagement', 'sentiment_score']].head(10))
+            st.dataframe(df_geo.nlargest(10, 'engagement')[['location', 'posts', 'engagement', 'sentiment_score']])
     
     else:
         # Show instructions when no tracking is active
         st.info("🎯 **Start Unified Tracking** above to analyze geographic spread")
         
-        st.markdown("""
-        ### 🌍 Geographic Spread Features
-        
-        When you start tracking content, this tab will show:
-        
-        #### 🗺️ **Interactive Map Visualization**
-        - Real-time geographic distribution of posts
-        - Sentiment color-coding by location
-        - Engagement size indicators
-        - Zoom and pan capabilities
-        
-        #### 📊 **Geographic Analytics**
-        - Top locations by engagement
-        - Regional sentiment analysis
-        - Geographic trend patterns
-        - Cross-border spread tracking
-        
-        #### 🇮🇳 **India-Specific Features**
-        - State-wise breakdown
-        - District-level analysis
-        - IST timezone alignment
-        - Regional language detection
-        
-        **Start tracking above to see live geographic analysis!**
-        """)
+        st.markdown(GEOGRAPHIC_SPREAD_INSTRUCTIONS)
+
+with tab5:
+    if tab5.open:
+        render_geographic_spread()
+
+# Static instructions shown in the evidence collection tab until it has data
+EVIDENCE_COLLECTION_INSTRUCTIONS = """
+### 📋 Evidence Collection Features
+
+When you start tracking content, this tab will show:
+
+#### 🔍 **Digital Forensics**
+- Automated evidence preservation
+- Cryptographic hash verification
+- Metadata extraction and analysis
+- Chain of custody documentation
+
+#### ⚖️ **Legal Compliance**
+- IT Act 2000 compliance
+- Evidence Act 1872 standards
+- CrPC 1973 procedures
+- Court-admissible documentation
+
+#### 🔒 **Security Features**
+- End-to-end encryption
+- Tamper-proof storage
+- Access audit trails
+- Multi-level authentication
+
+**Start tracking above to begin evidence collection!**
+"""
 
 # Tab 6: Evidence Collection
-with tab6:
+@st.fragment
+def render_evidence_collection():
+    """Render the evidence collection tab"""
     st.subheader("📋 Evidence Collection & Legal Compliance")
     
     # Check if unified tracking is active
@@ -2457,19 +2869,15 @@ with tab6:
         if st.button("📋 Start Evidence Collection", type="primary"):
             with st.spinner("Collecting and preserving evidence..."):
                 try:
-                    # Generate synthetic evidence data
-                    evidence_items = []
-                    for i in range(np.random.randint(5, 15)):
-                        evidence_items.append({
-                            'evidence_id': f"EVD_{datetime.now().strftime('%Y%m%d')}_{i+1:03d}",
-                            'type': np.random.choice(['Post', 'Image', 'Video', 'Profile', 'Metadata']),
-                            'platform': np.random.choice(tracking_platforms if tracking_platforms else ['twitter']),
-                            'timestamp': (datetime.now() - timedelta(hours=np.random.randint(1, 48))).isoformat(),
-                            'hash': f"sha256:{np.random.randint(100000, 999999)}",
-                            'size': f"{np.random.randint(1, 100)} KB",
-                            'status': 'Preserved',
-                            'legal_compliance': legal_standard
-                        })
+                    # Generate synthetic evidence data, reproducible per tracked input
+                    seed = stable_seed(f"{legal_standard}:{tracking_input}")
+                    evidence_items = build_evidence_items(
+                        5 + seed % 10,
+                        tuple(tracking_platforms) if tracking_platforms else ('twitter',),
+                        legal_standard,
+                        seed,
+                        int(time.time() // 60)
+                    )
                     
                     # Store in session state
                     st.session_state.evidence_data = evidence_items
@@ -2479,30 +2887,27 @@ with tab6:
                     st.error(f"Evidence collection error: {e}")
         
         # Display evidence if available
-        if st.session_state.get('evidence_data'):
-            evidence_data = st.session_state.evidence_data
+        if st.session_state.get('evidence_data') is not None:
+            df_evidence = st.session_state.evidence_data
             
             # Evidence summary
             st.markdown("### 📊 Evidence Summary")
             summary_col1, summary_col2, summary_col3, summary_col4 = st.columns(4)
             
             with summary_col1:
-                st.metric("Total Items", len(evidence_data))
+                st.metric("Total Items", len(df_evidence))
             
             with summary_col2:
-                platforms = set([item['platform'] for item in evidence_data])
-                st.metric("Platforms", len(platforms))
+                st.metric("Platforms", df_evidence['platform'].nunique())
             
             with summary_col3:
-                types = set([item['type'] for item in evidence_data])
-                st.metric("Evidence Types", len(types))
+                st.metric("Evidence Types", df_evidence['type'].nunique())
             
             with summary_col4:
                 st.metric("Compliance", legal_standard)
             
             # Evidence table
             st.markdown("### 📋 Evidence Inventory")
-            df_evidence = pd.DataFrame(evidence_data)
             st.dataframe(df_evidence, use_container_width=True)
             
             # Chain of custody
@@ -2510,10 +2915,10 @@ with tab6:
             st.info(f"""
             **Case Number:** FIR_001_2025_CYBER_CELL
             **Investigating Officer:** Inspector_Sharma
-            **Collection Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S IST')}
+            **Collection Time:** {datetime.now(IST).strftime('%Y-%m-%d %H:%M:%S IST')}
             **Legal Authority:** Valid Warrant Active
             **Preservation Standard:** {preservation_level}
-            **Total Evidence Items:** {len(evidence_data)}
+            **Total Evidence Items:** {len(df_evidence)}
             """)
             
             # Export options
@@ -2532,34 +2937,85 @@ with tab6:
         # Show instructions when no tracking is active
         st.info("🎯 **Start Unified Tracking** above to collect digital evidence")
         
-        st.markdown("""
-        ### 📋 Evidence Collection Features
-        
-        When you start tracking content, this tab will show:
-        
-        #### 🔍 **Digital Forensics**
-        - Automated evidence preservation
-        - Cryptographic hash verification
-        - Metadata extraction and analysis
-        - Chain of custody documentation
-        
-        #### ⚖️ **Legal Compliance**
-        - IT Act 2000 compliance
-        - Evidence Act 1872 standards
-        - CrPC 1973 procedures
-        - Court-admissible documentation
-        
-        #### 🔒 **Security Features**
-        - End-to-end encryption
-        - Tamper-proof storage
-        - Access audit trails
-        - Multi-level authentication
-        
-        **Start tracking above to begin evidence collection!**
-        """)
+        st.markdown(EVIDENCE_COLLECTION_INSTRUCTIONS)
+
+with tab6:
+    if tab6.open:
+        render_evidence_collection()
+
+SEARCH_TABLE_COLUMNS = ['platform', 'author', 'content', 'timestamp', 'engagement', 'sentiment', 'relevance_score']
+
+@st.cache_data(show_spinner=False, max_entries=8, hash_funcs=PANDAS_HASH_FUNCS)
+def summarize_search_results(df_results: pd.DataFrame) -> Dict[str, Any]:
+    """Compute the search tab's metrics, distributions and display table once per result set"""
+    return {
+        'platform_count': df_results['platform'].nunique(),
+        'avg_engagement': df_results['engagement'].mean(),
+        'positive_pct': (df_results['sentiment'] == 'Positive').mean() * 100,
+        'sentiment_counts': df_results['sentiment'].value_counts(),
+        'platform_counts': collapse_long_tail(df_results['platform'].value_counts()),
+        'table': df_results[SEARCH_TABLE_COLUMNS].assign(
+            timestamp=pd.to_datetime(df_results['timestamp'], format='ISO8601').dt.strftime('%Y-%m-%d %H:%M:%S')
+        )
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs=PANDAS_HASH_FUNCS)
+def build_search_sentiment_pie(sentiment_counts: pd.Series, search_query: str) -> dict:
+    """Build the search sentiment distribution pie, cached on the counts"""
+    fig = px.pie(
+        values=sentiment_counts.values,
+        names=sentiment_counts.index,
+        title=f"Sentiment Distribution - {search_query}",
+        color_discrete_map=SEARCH_SENTIMENT_COLORS
+    )
+    return fig.to_dict()
+
+@st.cache_data(show_spinner=False, max_entries=32, hash_funcs=PANDAS_HASH_FUNCS)
+def build_search_platform_bar(platform_counts: pd.Series, search_query: str) -> dict:
+    """Build the search results-by-platform bar chart, cached on the counts"""
+    fig = px.bar(
+        x=platform_counts.index,
+        y=platform_counts.values,
+        title=f"Results by Platform - {search_query}",
+        labels={'x': 'Platform', 'y': 'Number of Posts'}
+    )
+    return fig.to_dict()
+
+# Static instructions shown in the realtime search tab until it has data
+REALTIME_SEARCH_INSTRUCTIONS = """
+### 🔍 Real-time Search Features
+
+#### 🚀 **Multi-Platform Search**
+- Simultaneous search across all major platforms
+- Real-time result aggregation
+- Unified result formatting
+- Cross-platform deduplication
+
+#### 📊 **Advanced Analytics**
+- Sentiment analysis of results
+- Engagement pattern analysis
+- Platform-wise distribution
+- Relevance scoring
+
+#### 🔄 **Live Monitoring**
+- Continuous background monitoring
+- Real-time alert system
+- Automated result updates
+- Trend detection
+
+#### 🎯 **Search Types**
+- **Keywords**: General content search
+- **Hashtags**: Trending topic analysis
+- **Users**: Profile and activity monitoring
+- **Advanced**: Complex query combinations
+
+**Enter a search query above to start monitoring!**
+"""
 
 # Tab 7: Real-time Search
-with tab7:
+@st.fragment
+def render_realtime_search():
+    """Render the real-time search tab"""
     st.subheader("🔍 Real-time Search & Monitoring")
     
     # Real-time search interface
@@ -2622,48 +3078,50 @@ with tab7:
                     
                     # Collect hashtag data
                     if search_type == "Hashtags" or search_query.startswith('#'):
-                        search_results = twitter_collector.collect_hashtag_data(search_query, result_limit)
+                        search_results = fetch_hashtag_data(twitter_collector, search_query, result_limit)
                         
-                        # Convert to expected format
-                        formatted_results = []
-                        for result in search_results:
-                            formatted_results.append({
-                                'id': result.get('post_id', f"post_{len(formatted_results)+1}"),
-                                'platform': result.get('platform', 'Twitter'),
-                                'content': result.get('content', ''),
-                                'author': result.get('author', '@unknown'),
-                                'timestamp': result.get('timestamp', datetime.now().isoformat()),
-                                'engagement': result.get('engagement', 0),
-                                'sentiment': result.get('sentiment', 'Neutral'),
-                                'relevance_score': np.random.uniform(0.7, 1.0)
-                            })
-                        
-                        search_results = formatted_results
+                        # Convert to expected format, one column at a time
+                        now_iso = datetime.now().isoformat()
+                        df_results = pd.DataFrame({
+                            'id': [result.get('post_id', f"post_{i+1}") for i, result in enumerate(search_results)],
+                            'platform': [result.get('platform', 'Twitter') for result in search_results],
+                            'content': [result.get('content', '') for result in search_results],
+                            'author': [result.get('author', '@unknown') for result in search_results],
+                            'timestamp': [result.get('timestamp', now_iso) for result in search_results],
+                            'engagement': [result.get('engagement', 0) for result in search_results],
+                            'sentiment': [result.get('sentiment', 'Neutral') for result in search_results],
+                            'relevance_score': get_rng().uniform(0.7, 1.0, size=len(search_results))
+                        })
                         
                         # Also get original source analysis
                         original_analysis = twitter_collector.find_original_source(search_query)
                         st.session_state.original_analysis = original_analysis
                         
                     else:
-                        # Fallback to mock data for non-hashtag searches
-                        search_results = []
-                        for i in range(np.random.randint(20, result_limit)):
-                            platform = np.random.choice(search_platforms if search_platforms else ['Twitter'])
-                            search_results.append({
-                                'id': f"post_{i+1}",
-                                'platform': platform,
-                                'content': f"Sample content related to {search_query} - post {i+1}",
-                                'author': f"@user_{np.random.randint(1000, 9999)}",
-                                'timestamp': (datetime.now() - timedelta(minutes=np.random.randint(1, 1440))).isoformat(),
-                                'engagement': np.random.randint(1, 1000),
-                                'sentiment': np.random.choice(['Positive', 'Negative', 'Neutral']),
-                                'relevance_score': np.random.uniform(0.5, 1.0)
-                            })
+                        # Fallback to mock data for non-hashtag searches, drawn column-wise from a query-seeded generator
+                        now = np.datetime64(datetime.now(), 'us')
+                        rng = np.random.default_rng(stable_seed(search_query))
+                        n = int(rng.integers(20, result_limit))
+                        post_numbers = np.arange(1, n + 1).astype(str)
+                        df_results = pd.DataFrame({
+                            'id': np.char.add('post_', post_numbers),
+                            'platform': rng.choice(search_platforms if search_platforms else ['Twitter'], size=n),
+                            'content': np.char.add(f"Sample content related to {search_query} - post ", post_numbers),
+                            'author': np.char.add('@user_', rng.integers(1000, 9999, size=n).astype(str)),
+                            'timestamp': np.datetime_as_string(
+                                now - rng.integers(1, 1440, size=n).astype('timedelta64[m]'), unit='us'
+                            ),
+                            'engagement': rng.integers(1, 1000, size=n),
+                            'sentiment': rng.choice(['Positive', 'Negative', 'Neutral'], size=n),
+                            'relevance_score': rng.uniform(0.5, 1.0, size=n)
+                        })
                     
                     # Store in session state
-                    st.session_state.search_results = search_results
+                    st.session_state.search_results = df_results.convert_dtypes(dtype_backend='pyarrow').astype(
+                        {'platform': 'category', 'sentiment': 'category'}
+                    )
                     st.session_state.search_query = search_query
-                    st.success(f"✅ Found {len(search_results)} results for '{search_query}'")
+                    st.success(f"✅ Found {len(df_results)} results for '{search_query}'")
                     
                 except Exception as e:
                     logger.error(f"Search error: {e}")
@@ -2672,60 +3130,40 @@ with tab7:
             st.error("Please enter a search query")
     
     # Display search results if available
-    if st.session_state.get('search_results'):
-        search_results = st.session_state.search_results
+    df_results = st.session_state.get('search_results')
+    if df_results is not None and not df_results.empty:
         search_query = st.session_state.get('search_query', '')
+        summary = summarize_search_results(df_results)
         
         # Search metrics
         st.markdown("### 📊 Search Results Summary")
         result_col1, result_col2, result_col3, result_col4 = st.columns(4)
         
         with result_col1:
-            st.metric("Total Results", len(search_results))
+            st.metric("Total Results", len(df_results))
         
         with result_col2:
-            platforms_found = set([result['platform'] for result in search_results])
-            st.metric("Platforms", len(platforms_found))
+            st.metric("Platforms", summary['platform_count'])
         
         with result_col3:
-            avg_engagement = np.mean([result['engagement'] for result in search_results])
-            st.metric("Avg Engagement", f"{avg_engagement:.0f}")
+            st.metric("Avg Engagement", f"{summary['avg_engagement']:.0f}")
         
         with result_col4:
-            positive_sentiment = len([r for r in search_results if r['sentiment'] == 'Positive'])
-            sentiment_ratio = positive_sentiment / len(search_results) * 100
-            st.metric("Positive Sentiment", f"{sentiment_ratio:.1f}%")
+            st.metric("Positive Sentiment", f"{summary['positive_pct']:.1f}%")
         
         # Sentiment distribution chart
         st.markdown("### 💭 Sentiment Distribution")
-        sentiment_counts = pd.DataFrame(search_results)['sentiment'].value_counts()
-        fig_sentiment = px.pie(
-            values=sentiment_counts.values,
-            names=sentiment_counts.index,
-            title=f"Sentiment Distribution - {search_query}",
-            color_discrete_map={'Positive': '#4CAF50', 'Negative': '#F44336', 'Neutral': '#FFC107'}
-        )
+        fig_sentiment = go.Figure(build_search_sentiment_pie(summary['sentiment_counts'], search_query))
         st.plotly_chart(fig_sentiment, use_container_width=True)
         
         # Platform distribution
         st.markdown("### 🌐 Platform Distribution")
-        platform_counts = pd.DataFrame(search_results)['platform'].value_counts()
-        fig_platform = px.bar(
-            x=platform_counts.index,
-            y=platform_counts.values,
-            title=f"Results by Platform - {search_query}",
-            labels={'x': 'Platform', 'y': 'Number of Posts'}
-        )
+        fig_platform = go.Figure(build_search_platform_bar(summary['platform_counts'], search_query))
         st.plotly_chart(fig_platform, use_container_width=True)
         
         # Results table
         st.markdown("### 📋 Search Results")
-        df_results = pd.DataFrame(search_results)
-        df_results['timestamp'] = pd.to_datetime(df_results['timestamp']).dt.strftime('%Y-%m-%d %H:%M:%S')
-        st.dataframe(
-            df_results[['platform', 'author', 'content', 'timestamp', 'engagement', 'sentiment', 'relevance_score']],
-            use_container_width=True
-        )
+        st.dataframe(summary['table'], use_container_width=True)
         
         # Original Source Analysis (for hashtag searches)
         if st.session_state.get('original_analysis') and (search_query.startswith('#') or search_type == "Hashtags"):
@@ -2828,337 +3266,78 @@ with tab7:
         # Show instructions when no search is active
         st.info("🔍 **Enter a search query** above to start real-time monitoring")
         
-        st.markdown("""
-        ### 🔍 Real-time Search Features
-        
-        #### 🚀 **Multi-Platform Search**
-        - Simultaneous search across all major platforms
-        - Real-time result aggregation
-        - Unified result formatting
-        - Cross-platform deduplication
-        
-        #### 📊 **Advanced Analytics**
-        - Sentiment analysis of results
-        - Engagement pattern analysis
-        - Platform-wise distribution
-        - Relevance scoring
-        
-        #### 🔄 **Live Monitoring**
-        - Continuous background monitoring
-        - Real-time alert system
-        - Automated result updates
-        - Trend detection
-        
-        #### 🎯 **Search Types**
-        - **Keywords**: General content search
-        - **Hashtags**: Trending topic analysis
-        - **Users**: Profile and activity monitoring
-        - **Advanced**: Complex query combinations
-        
-        **Enter a search query above to start monitoring!**
-        """)
+        st.markdown(REALTIME_SEARCH_INSTRUCTIONS)
+
+with tab7:
+    if tab7.open:
+        render_realtime_search()
 
 # Enhanced System Status and Analytics Overview - Moved above footer
+
 st.markdown("---")
 
 # Check NLP service status
-def check_nlp_service_status():
-    """Check if NLP service is running"""
+@st.cache_resource(show_spinner=False)
+def get_nlp_session() -> requests.Session:
+    """Get the pooled HTTP session used for NLP service health probes"""
+    session = requests.Session()
+    session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return session
+
+@st.cache_data(ttl=15, show_spinner=False)
+def check_nlp_service_status() -> bool:
+    """Check if NLP service is running, probing at most once every 15s"""
     try:
-        import requests
-        response = requests.get("http://localhost:8001/health", timeout=2)
+        response = get_nlp_session().get("http://localhost:8001/health", timeout=2)
         return response.status_code == 200
-    except:
+    except Exception:
         return False
 
-nlp_status = check_nlp_service_status()
-
 # Enhanced Analysis Overview with real-time data
-if cache_available:
+DEFAULT_OVERVIEW_STATS = (35809, 75, 1247)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def load_overview_stats(hours: int = 24) -> Tuple[int, float, int]:
+    """Get (total_posts, cache_rate, request_count) for the overview, refreshed at most every 60s"""
     try:
-        api_stats = cache_db.get_api_usage_stats(24)
-        overall_stats = api_stats.get('overall', {})
-        total_posts = overall_stats.get('total_api_calls', 35809)
-        cache_rate = overall_stats.get('cache_hit_rate', 0.75) * 100
-        requests = overall_stats.get('total_requests', 1247)
-    except:
-        total_posts = 35809
-        cache_rate = 75
-        requests = 1247
+        overall_stats = cache_db.get_api_usage_stats(hours).get('overall', {})
+        return (
+            overall_stats.get('total_api_calls', 35809),
+            overall_stats.get('cache_hit_rate', 0.75) * 100,
+            overall_stats.get('total_requests', 1247)
+        )
+    except Exception as e:
+        logger.warning(f"Could not load API usage stats: {e}")
+        return DEFAULT_OVERVIEW_STATS
+
+nlp_status = check_nlp_service_status()
+if cache_available:
+    if st.button("🔄 Refresh Stats", type="secondary"):
+        load_overview_stats.clear()
+    total_posts, cache_rate, request_count = load_overview_stats(24)
 else:
-    total_posts = 35809
-    cache_rate = 75
-    requests = 1247
+    total_posts, cache_rate, request_count = DEFAULT_OVERVIEW_STATS
 
-# Analysis Overview Section
-st.markdown(f"""
-<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); 
-            padding: 30px; border-radius: 15px; margin-bottom: 30px; color: white;">
-    <h2 style="color: white; margin: 0 0 25px 0; font-size: 24px; display: flex; align-items: center;">
-        📊 Analysis Overview <a href="#" style="margin-left: 10px; color: #4CAF50;">🔗</a>
-    </h2>
-    <div style="display: grid; grid-template-columns: repeat(4, 1fr); gap: 30px;">
-        <div style="text-align: center;">
-            <div style="font-size: 14px; color: #a0aec0; margin-bottom: 8px;">Total Posts</div>
-            <div style="font-size: 32px; font-weight: bold; color: white; margin-bottom: 5px;">{total_posts:,}</div>
-            <div style="font-size: 14px; color: #4CAF50; display: flex; align-items: center; justify-content: center;">
-                <span style="margin-right: 5px;">↑</span> +23%
-            </div>
-        </div>
-        <div style="text-align: center;">
-            <div style="font-size: 14px; color: #a0aec0; margin-bottom: 8px;">Avg Sentiment</div>
-            <div style="font-size: 32px; font-weight: bold; color: #4CAF50; margin-bottom: 5px;">Positive</div>
-            <div style="font-size: 14px; color: #4CAF50; display: flex; align-items: center; justify-content: center;">
-                <span style="margin-right: 5px;">↑</span> 0.05
-            </div>
-        </div>
-        <div style="text-align: center;">
-            <div style="font-size: 14px; color: #a0aec0; margin-bottom: 8px;">Trend Status</div>
-            <div style="font-size: 32px; font-weight: bold; color: #4CAF50; margin-bottom: 5px;">Rising</div>
-            <div style="font-size: 14px; color: #4CAF50; display: flex; align-items: center; justify-content: center;">
-                📈
-            </div>
-        </div>
-        <div style="text-align: center;">
-            <div style="font-size: 14px; color: #a0aec0; margin-bottom: 8px;">Peak Activity</div>
-            <div style="font-size: 24px; font-weight: bold; color: white; margin-bottom: 5px;">09/23 00:29</div>
-            <div style="font-size: 14px; color: #4CAF50; display: flex; align-items: center; justify-content: center;">
-                <span style="margin-right: 5px;">↑</span> IST
-            </div>
-        </div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+# Overview and status HTML shells live in templates/; each file is read once per process, not per rerun
+TEMPLATE_DIR = Path(__file__).parent / 'templates'
 
-# Enhanced System Status Section
-st.markdown(f"""
-<div style="background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); 
-            padding: 30px; border-radius: 15px; margin-bottom: 30px; color: white;">
-    <h2 style="color: white; margin: 0 0 25px 0; font-size: 24px; display: flex; align-items: center;">
-        🔧 System Status
-    </h2>
-    <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 30px;">
-        <div>
-            <h3 style="color: white; margin: 0 0 15px 0; font-size: 18px; display: flex; align-items: center;">
-                📊 Platform Status
-            </h3>
-            <div style="space-y: 8px;">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Twitter/X:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Online</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Facebook:</span>
-                    <span style="color: #f44336; font-weight: bold;">🔴 Offline</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Instagram:</span>
-                    <span style="color: #ff9800; font-weight: bold;">🟡 Limited</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Reddit:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Online</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">YouTube:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Online</span>
-                </div>
-            </div>
-        </div>
-        <div>
-            <h3 style="color: white; margin: 0 0 15px 0; font-size: 18px; display: flex; align-items: center;">
-                💾 Database Status
-            </h3>
-            <div style="space-y: 8px;">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">PostgreSQL:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Connected</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Redis Cache:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Active</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">ElasticSearch:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Indexed</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Evidence Store:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Secure</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">NLP Service:</span>
-                    <span style="color: {'#4CAF50' if nlp_status else '#f44336'}; font-weight: bold;">{'🟢 Connected' if nlp_status else '🔴 Offline'}</span>
-                </div>
-            </div>
-        </div>
-        <div>
-            <h3 style="color: white; margin: 0 0 15px 0; font-size: 18px; display: flex; align-items: center;">
-                🔒 Security Status
-            </h3>
-            <div style="space-y: 8px;">
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Encryption:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Active</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Authentication:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Verified</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Audit Trail:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Logging</span>
-                </div>
-                <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px;">
-                    <span style="color: white;">Compliance:</span>
-                    <span style="color: #4CAF50; font-weight: bold;">🟢 Monitored</span>
-                </div>
-            </div>
-        </div>
-    </div>
-</div>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_html_template(name: str) -> string.Template:
+    """Read an HTML template from the templates directory"""
+    return string.Template((TEMPLATE_DIR / name).read_text(encoding='utf-8'))
 
+@st.cache_resource(max_entries=16)
+def analysis_overview_html(total_posts: int) -> str:
+    """Render the analysis overview block for a post count"""
+    return load_html_template('overview.html').substitute(total_posts=f"{total_posts:,}")
 
-def calculate_time_span(nodes: List[Dict]) -> str:
-    """Calculate time span of the network"""
-    timestamps = [datetime.fromisoformat(node['timestamp']) for node in nodes]
-    if len(timestamps) < 2:
-        return "N/A"
-    
-    time_span = max(timestamps) - min(timestamps)
-    
-    if time_span.days > 0:
-        return f"{time_span.days} days"
-    elif time_span.seconds > 3600:
-        return f"{time_span.seconds // 3600} hours"
-    else:
-        return f"{time_span.seconds // 60} minutes"
+@st.cache_resource
+def system_status_html(nlp_status: bool) -> str:
+    """Render the system status block for an NLP service state, once per state per process"""
+    nlp_color, nlp_label = ('#4CAF50', '🟢 Connected') if nlp_status else ('#f44336', '🔴 Offline')
+    return load_html_template('system_status.html').substitute(nlp_color=nlp_color, nlp_label=nlp_label)
 
-def calculate_confidence_score(network_data: Dict) -> float:
-    """Calculate confidence score for source identification"""
-    nodes = network_data['nodes']
-    edges = network_data['edges']
-    
-    # Factors affecting confidence
-    node_count_factor = min(len(nodes) / 10, 1.0)  # More nodes = higher confidence
-    edge_density = len(edges) / max(len(nodes) * (len(nodes) - 1) / 2, 1)
-    time_consistency = 0.8  # Assume good time consistency
-    
-    # Calculate weighted confidence
-    confidence = (node_count_factor * 0.3 + edge_density * 0.3 + time_consistency * 0.4)
-    
-    return min(confidence, 0.95)  # Cap at 95%
+st.markdown(analysis_overview_html(total_posts), unsafe_allow_html=True)
 
-def convert_realtime_to_timeline(search_results: List[Dict], timeline_range: str) -> Dict[str, Any]:
-    """Convert real-time search results to timeline format for visualization"""
-    
-    # Parse timeline range
-    if timeline_range == "Last 24 Hours":
-        hours = 24
-        time_points = [datetime.now() - timedelta(hours=i) for i in range(hours, 0, -1)]
-    elif timeline_range == "Last 1 Week":
-        days = 7
-        time_points = [datetime.now() - timedelta(days=i) for i in range(days, 0, -1)]
-    elif timeline_range == "Last 1 Month":
-        days = 30
-        time_points = [datetime.now() - timedelta(days=i) for i in range(days, 0, -1)]
-    else:
-        hours = 24
-        time_points = [datetime.now() - timedelta(hours=i) for i in range(hours, 0, -1)]
-    
-    # Initialize timeline data structure
-    timeline_data = {
-        'timestamps': [tp.isoformat() for tp in time_points],
-        'post_counts': [0] * len(time_points),
-        'engagement_counts': [0] * len(time_points),
-        'sentiment_scores': [0.0] * len(time_points),
-        'viral_scores': [0.0] * len(time_points),
-        'platforms': {},
-        'top_posts': [],
-        'total_posts': len(search_results),
-        'total_engagement': 0,
-        'avg_sentiment': 0.0
-    }
-    
-    # Process search results
-    total_sentiment = 0
-    total_engagement = 0
-    
-    for post in search_results:
-        try:
-            # Parse post timestamp
-            if isinstance(post.get('timestamp'), str):
-                post_time = datetime.fromisoformat(post['timestamp'].replace('Z', '+00:00'))
-            elif isinstance(post.get('timestamp'), datetime):
-                post_time = post['timestamp']
-            else:
-                post_time = datetime.now()  # Fallback
-            
-            # Find the appropriate time bucket
-            for i, time_point in enumerate(time_points):
-                if post_time >= time_point:
-                    timeline_data['post_counts'][i] += 1
-                    
-                    # Add engagement metrics
-                    engagement = post.get('engagement_metrics', {})
-                    post_engagement = sum([
-                        engagement.get('likes', 0),
-                        engagement.get('shares', 0),
-                        engagement.get('comments', 0),
-                        engagement.get('views', 0)
-                    ])
-                    timeline_data['engagement_counts'][i] += post_engagement
-                    total_engagement += post_engagement
-                    
-                    # Add sentiment score
-                    sentiment = post.get('sentiment_score', 0.0)
-                    timeline_data['sentiment_scores'][i] += sentiment
-                    total_sentiment += sentiment
-                    
-                    # Add viral score (calculated from engagement)
-                    viral_score = min(post_engagement / 1000, 1.0)  # Normalize to 0-1
-                    timeline_data['viral_scores'][i] += viral_score
-                    
-                    # Track platform distribution
-                    platform = post.get('platform', 'unknown')
-                    if platform not in timeline_data['platforms']:
-                        timeline_data['platforms'][platform] = 0
-                    timeline_data['platforms'][platform] += 1
-                    
-                    break
-            
-            # Add to top posts if high engagement
-            if post_engagement > 100:  # Threshold for "top" posts
-                timeline_data['top_posts'].append({
-                    'content': post.get('content', '')[:200] + '...',
-                    'author': post.get('author_handle', 'Unknown'),
-                    'platform': post.get('platform', 'unknown'),
-                    'engagement': post_engagement,
-                    'timestamp': post_time.isoformat(),
-                    'url': post.get('url', '#')
-                })
-                
-        except Exception as e:
-            logger.warning(f"Error processing post: {e}")
-            continue
-    
-    # Calculate averages
-    timeline_data['total_engagement'] = total_engagement
-    timeline_data['avg_sentiment'] = total_sentiment / max(len(search_results), 1)
-    
-    # Sort top posts by engagement
-    timeline_data['top_posts'] = sorted(
-        timeline_data['top_posts'], 
-        key=lambda x: x['engagement'], 
-        reverse=True
-    )[:10]  # Keep top 10
-    
-    # Normalize sentiment scores per time point
-    for i in range(len(timeline_data['sentiment_scores'])):
-        if timeline_data['post_counts'][i] > 0:
-            timeline_data['sentiment_scores'][i] /= timeline_data['post_counts'][i]
-        if timeline_data['viral_scores'][i] > 0:
-            timeline_data['viral_scores'][i] /= timeline_data['post_counts'][i]
-    
-    return timeline_data
+# Enhanced System Status Section
+st.markdown(system_status_html(nlp_status), unsafe_allow_html=True)
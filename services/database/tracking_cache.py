@@ -97,6 +97,19 @@ class TrackingCacheDB:
         key_string = f"{platform}:{query_type}:{query_value.lower()}"
         return hashlib.md5(key_string.encode()).hexdigest()
     
+    def _row_to_cached_data(self, row: Tuple) -> CachedTrackingData:
+        """Build a CachedTrackingData from a tracking_cache row"""
+        return CachedTrackingData(
+            cache_key=row[0],
+            platform=row[1],
+            query_type=row[2],
+            query_value=row[3],
+            data=json.loads(row[4]),
+            timestamp=datetime.fromisoformat(row[5]),
+            expires_at=datetime.fromisoformat(row[6]),
+            api_calls_used=row[7]
+        )
+    
     def get_cached_data(self, platform: str, query_type: str, query_value: str) -> Optional[CachedTrackingData]:
         """Retrieve cached data if available and not expired"""
         cache_key = self._generate_cache_key(platform, query_type, query_value)
@@ -111,18 +124,33 @@ class TrackingCacheDB:
             
             row = cursor.fetchone()
             if row:
-                return CachedTrackingData(
-                    cache_key=row[0],
-                    platform=row[1],
-                    query_type=row[2],
-                    query_value=row[3],
-                    data=json.loads(row[4]),
-                    timestamp=datetime.fromisoformat(row[5]),
-                    expires_at=datetime.fromisoformat(row[6]),
-                    api_calls_used=row[7]
-                )
+                return self._row_to_cached_data(row)
         return None
     
+    def get_cached_data_batch(self, keys: List[Tuple[str, str, str]]) -> Dict[Tuple[str, str, str], Optional[CachedTrackingData]]:
+        """Retrieve unexpired cached data for several (platform, query_type, query_value) keys in one query"""
+        cache_keys: Dict[str, List[Tuple[str, str, str]]] = {}
+        for key in keys:
+            cache_keys.setdefault(self._generate_cache_key(*key), []).append(key)
+        results = {key: None for key in keys}
+        if not cache_keys:
+            return results
+        
+        placeholders = ", ".join("?" * len(cache_keys))
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.execute(f"""
+                SELECT cache_key, platform, query_type, query_value, data, 
+                       timestamp, expires_at, api_calls_used
+                FROM tracking_cache 
+                WHERE cache_key IN ({placeholders}) AND expires_at > ?
+            """, (*cache_keys, datetime.now().isoformat()))
+            
+            for row in cursor.fetchall():
+                cached = self._row_to_cached_data(row)
+                for key in cache_keys[row[0]]:
+                    results[key] = cached
+        return results
+    
     def cache_data(self, platform: str, query_type: str, query_value: str, 
                    data: Dict[str, Any], cache_duration_hours: int = 24, 
                    api_calls_used: int = 1) -> str:
@@ -45,6 +45,10 @@ class EnhancedLanguageSupport:
     
     def __init__(self):
         self.languages = self._initialize_languages()
+        self.detection_patterns = {
+            code: [re.compile(pattern, re.IGNORECASE) for pattern in lang.content_detection_patterns]
+            for code, lang in self.languages.items()
+        }
         
     def _initialize_languages(self) -> Dict[str, LanguageConfig]:
         """Initialize supported languages"""
@@ -85,17 +89,17 @@ class EnhancedLanguageSupport:
             return []
         
         language_scores = {}
+        text_length = len(text)
         
-        for lang_code, lang_config in self.languages.items():
+        for lang_code, patterns in self.detection_patterns.items():
             score = 0.0
-            text_length = len(text)
             
-            # Check script patterns
-            for pattern in lang_config.content_detection_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+            # Check script patterns (compiled once in __init__)
+            for pattern in patterns:
+                matches = pattern.findall(text)
                 if matches:
                     # Calculate score based on character coverage
-                    matched_chars = sum(len(match) for match in matches)
+                    matched_chars = sum(map(len, matches))
                     script_score = min(1.0, matched_chars / text_length)
                     score = max(score, script_score)
             
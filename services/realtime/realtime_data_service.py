@@ -6,11 +6,12 @@ Provides unified real-time data access across all dashboard components
 
 import asyncio
 import logging
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 import pandas as pd
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import networkx as nx
 
 from .social_media_connectors import SocialMediaAggregator
@@ -42,6 +43,10 @@ class RealTimePost:
     thread_id: Optional[str]  # For tracking conversations
     media_urls: List[str]
     verified_author: bool
+    engagement_total: int = field(init=False, compare=False)
+    
+    def __post_init__(self):
+        self.engagement_total = sum(self.engagement.values())
 
 @dataclass
 class InfluenceNode:
@@ -114,7 +119,7 @@ class RealTimeDataService:
                     "content": post.content,
                     "timestamp": post.timestamp,
                     "viral_score": post.viral_score,
-                    "engagement": sum(post.engagement.values()),
+                    "engagement": post.engagement_total,
                     "language": post.language,
                     "location": post.location,
                     "sentiment_score": post.sentiment_score,
@@ -325,23 +330,21 @@ class RealTimeDataService:
     
     def _analyze_trends(self, posts: List[RealTimePost]) -> List[Dict[str, Any]]:
         """Analyze trending topics from posts"""
-        hashtag_counts = {}
-        keyword_counts = {}
+        hashtag_counts = Counter()
+        keyword_counts = Counter()
         
         for post in posts:
             # Count hashtags
-            for hashtag in post.hashtags:
-                hashtag_counts[hashtag] = hashtag_counts.get(hashtag, 0) + 1
+            hashtag_counts.update(post.hashtags)
             
             # Extract keywords from content
-            words = post.content.lower().split()
-            for word in words:
-                if len(word) > 3 and word.isalpha():
-                    keyword_counts[word] = keyword_counts.get(word, 0) + 1
+            keyword_counts.update(
+                word for word in post.content.lower().split() if len(word) > 3 and word.isalpha()
+            )
         
         # Get top trends
-        top_hashtags = sorted(hashtag_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        top_keywords = sorted(keyword_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        top_hashtags = hashtag_counts.most_common(10)
+        top_keywords = keyword_counts.most_common(10)
         
         trends = []
         for hashtag, count in top_hashtags:
@@ -364,24 +367,15 @@ class RealTimeDataService:
     
     def _get_platform_distribution(self, posts: List[RealTimePost]) -> Dict[str, int]:
         """Get platform distribution"""
-        distribution = {}
-        for post in posts:
-            distribution[post.platform] = distribution.get(post.platform, 0) + 1
-        return distribution
+        return dict(Counter(post.platform for post in posts))
     
     def _get_language_distribution(self, posts: List[RealTimePost]) -> Dict[str, int]:
         """Get language distribution"""
-        distribution = {}
-        for post in posts:
-            distribution[post.language] = distribution.get(post.language, 0) + 1
-        return distribution
+        return dict(Counter(post.language for post in posts))
     
     def _get_risk_distribution(self, posts: List[RealTimePost]) -> Dict[str, int]:
         """Get risk level distribution"""
-        distribution = {}
-        for post in posts:
-            distribution[post.risk_level] = distribution.get(post.risk_level, 0) + 1
-        return distribution
+        return dict(Counter(post.risk_level for post in posts))
     
     def _create_sentiment_timeline(self, posts: List[RealTimePost]) -> List[Dict[str, Any]]:
         """Create sentiment timeline data"""
@@ -402,7 +396,7 @@ class RealTimeDataService:
                 "timestamp": hour,
                 "sentiment_score": avg_sentiment,
                 "post_count": len(hour_posts),
-                "avg_engagement": np.mean([sum(p.engagement.values()) for p in hour_posts])
+                "avg_engagement": np.mean([p.engagement_total for p in hour_posts])
             })
         
         return sorted(timeline_data, key=lambda x: x["timestamp"])
@@ -416,18 +410,16 @@ class RealTimeDataService:
             "user_behavior": {}
         }
         
-        # Analyze posting frequency by hour
-        hourly_posts = {}
-        for post in posts:
-            hour = post.timestamp.hour
-            hourly_posts[hour] = hourly_posts.get(hour, 0) + 1
-        patterns["posting_frequency"] = hourly_posts
+        # Analyze posting frequency by hour (dense 0-23 so every hour is present and ordered)
+        hours = np.fromiter((post.timestamp.hour for post in posts), dtype=np.intp, count=len(posts))
+        patterns["posting_frequency"] = dict(enumerate(np.bincount(hours, minlength=24).tolist()))
         
         # Analyze engagement patterns
-        high_engagement = [p for p in posts if sum(p.engagement.values()) > np.percentile([sum(p.engagement.values()) for p in posts], 75)]
+        engagement_threshold = np.percentile([p.engagement_total for p in posts], 75)
+        high_engagement = [p for p in posts if p.engagement_total > engagement_threshold]
         patterns["engagement_patterns"] = {
             "high_engagement_count": len(high_engagement),
-            "avg_high_engagement": np.mean([sum(p.engagement.values()) for p in high_engagement]) if high_engagement else 0
+            "avg_high_engagement": np.mean([p.engagement_total for p in high_engagement]) if high_engagement else 0
         }
         
         return patterns
@@ -448,13 +440,13 @@ class RealTimeDataService:
                     follower_count=0,  # Would need to fetch from API
                     influence_score=post.influence_score,
                     post_count=1,
-                    engagement_rate=sum(post.engagement.values()),
+                    engagement_rate=post.engagement_total,
                     verified=post.verified_author,
                     location=post.location
                 )
             else:
                 nodes[post.author_id].post_count += 1
-                nodes[post.author_id].engagement_rate += sum(post.engagement.values())
+                nodes[post.author_id].engagement_rate += post.engagement_total
         
         # Calculate average engagement rates
         for node in nodes.values():
@@ -535,7 +527,7 @@ class RealTimeDataService:
                     "timestamp": post.timestamp,
                     "sentiment_score": post.sentiment_score,
                     "viral_score": post.viral_score,
-                    "engagement": sum(post.engagement.values())
+                    "engagement": post.engagement_total
                 })
         
         # Create heatmap data
@@ -603,14 +595,14 @@ class RealTimeDataService:
         
         return {
             "total_posts": len(evidence_data),
-            "platforms": list(set(p.platform for p in evidence_data)),
+            "platforms": list({p.platform for p in evidence_data}),
             "date_range": {
                 "start": min(p.timestamp for p in evidence_data),
                 "end": max(p.timestamp for p in evidence_data)
             },
             "avg_viral_score": np.mean([p.viral_score for p in evidence_data]),
-            "high_risk_posts": len([p for p in evidence_data if p.risk_level == "high"]),
-            "unique_authors": len(set(p.author_id for p in evidence_data))
+            "high_risk_posts": sum(1 for p in evidence_data if p.risk_level == "high"),
+            "unique_authors": len({p.author_id for p in evidence_data})
         }
     
     # Additional search methods for real-time data integration
@@ -264,17 +264,15 @@ class TrackingInterface:
             # Create layout
             pos = nx.spring_layout(G, k=2, iterations=50)
             
-            # Prepare edge traces
-            edge_x = []
-            edge_y = []
-            edge_info = []
+            # Prepare edge traces as preallocated (source, target, NaN) triples filled by slicing
+            node_index = {node: i for i, node in enumerate(pos)}
+            pos_arr = np.array(list(pos.values()), dtype=np.float64).reshape(-1, 2)
+            edge_idx = np.array([(node_index[u], node_index[v]) for u, v in G.edges()], dtype=np.intp).reshape(-1, 2)
             
-            for edge in G.edges(data=True):
-                if edge[0] in pos and edge[1] in pos:
-                    x0, y0 = pos[edge[0]]
-                    x1, y1 = pos[edge[1]]
-                    edge_x.extend([x0, x1, None])
-                    edge_y.extend([y0, y1, None])
+            edge_x = np.full(3 * len(edge_idx), np.nan)
+            edge_y = np.full(3 * len(edge_idx), np.nan)
+            edge_x[0::3], edge_x[1::3] = pos_arr[edge_idx[:, 0], 0], pos_arr[edge_idx[:, 1], 0]
+            edge_y[0::3], edge_y[1::3] = pos_arr[edge_idx[:, 0], 1], pos_arr[edge_idx[:, 1], 1]
             
             edge_trace = go.Scatter(
                 x=edge_x, y=edge_y,
@@ -422,14 +420,29 @@ class TrackingInterface:
         
         with col2:
             st.markdown("#### 👑 Top Influencers")
-            top_influencers = influence_data.get('top_influencers', {})
+            top_influencers = list(influence_data.get('top_influencers', {}).values())[:5]
             
-            for i, (user_id, data) in enumerate(list(top_influencers.items())[:5]):
-                with st.expander(f"#{i+1} @{data.get('username', 'Unknown')}"):
-                    st.write(f"**Influence Score:** {data.get('influence_score', 0):.2f}")
-                    st.write(f"**Total Engagement:** {data.get('total_engagement', 0):,}")
-                    st.write(f"**Post Count:** {data.get('post_count', 0)}")
-                    st.write(f"**Avg Engagement:** {data.get('avg_engagement', 0):.0f}")
+            # One table element instead of an expander per influencer
+            if top_influencers:
+                df_influencers = pd.DataFrame({
+                    'User': [f"@{data.get('username', 'Unknown')}" for data in top_influencers],
+                    'Influence Score': [data.get('influence_score', 0) for data in top_influencers],
+                    'Total Engagement': [data.get('total_engagement', 0) for data in top_influencers],
+                    'Post Count': [data.get('post_count', 0) for data in top_influencers],
+                    'Avg Engagement': [data.get('avg_engagement', 0) for data in top_influencers]
+                }, index=pd.RangeIndex(1, len(top_influencers) + 1, name='Rank'))
+                
+                st.dataframe(
+                    df_influencers,
+                    use_container_width=True,
+                    column_config={
+                        'Influence Score': st.column_config.ProgressColumn(
+                            format='%.2f', min_value=0.0,
+                            max_value=float(df_influencers['Influence Score'].max()) or 1.0
+                        ),
+                        'Avg Engagement': st.column_config.NumberColumn(format='%.0f')
+                    }
+                )
     
     def _render_export_options(self, result: TrackingResult):
         """Render export options"""
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Dashboard Helper Test Suite
+Tests the pure data helpers in the Streamlit dashboard script
+"""
+
+import unittest
+import importlib
+import tempfile
+import sys
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def load_dashboard():
+    """Import the dashboard script in Streamlit bare mode, keeping its SQLite cache out of the repo"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            return importlib.import_module('enhanced_viral_dashboard')
+        finally:
+            os.chdir(cwd)
+
+
+class TestConvertRealtimeToTimeline(unittest.TestCase):
+    """Test bucketing of real-time posts into the timeline"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dashboard = load_dashboard()
+        cls.now = datetime(2026, 1, 15, 12, 0)
+        cls.time_points = [cls.now - timedelta(hours=i) for i in range(24, 0, -1)]
+
+    def convert(self, posts):
+        with patch.object(self.dashboard, 'timeline_time_points', return_value=self.time_points):
+            return self.dashboard.convert_realtime_to_timeline(posts, "Last 24 Hours")
+
+    def post(self, timestamp, engagement, sentiment, platform='twitter', content='post'):
+        return {
+            'timestamp': timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+            'engagement_metrics': engagement,
+            'sentiment_score': sentiment,
+            'platform': platform,
+            'content': content
+        }
+
+    def sample_posts(self):
+        first_edge, last_edge = self.time_points[0], self.time_points[-1]
+        return [
+            # Exactly on the first bucket edge
+            self.post(first_edge, {'likes': 200}, 0.5, content='first-edge'),
+            # One second before the range starts, with the highest engagement
+            self.post(first_edge - timedelta(seconds=1), {'likes': 5000}, -1.0, content='too-old'),
+            # Exactly on the last bucket edge
+            self.post(last_edge, {'likes': 100, 'shares': 20, 'comments': 5, 'views': 1000}, 0.1,
+                      platform='reddit', content='last-edge'),
+            # Inside the open-ended last bucket, below the top-post threshold
+            self.post(self.now - timedelta(minutes=30), {'likes': 50}, -0.3, content='recent'),
+            # Middle bucket with a fractional engagement value
+            self.post(self.time_points[14] + timedelta(minutes=5), {'likes': 150.4}, 0.2, content='middle'),
+            # Unreadable timestamp is skipped
+            self.post('garbage', {'likes': 999}, 0.9, content='malformed')
+        ]
+
+    def test_bucket_counts(self):
+        """Posts land in the bucket of the latest edge at or before them; older posts are dropped"""
+        result = self.convert(self.sample_posts())
+
+        expected = [0] * 24
+        expected[0], expected[14], expected[23] = 1, 1, 2
+        self.assertEqual(result['post_counts'], expected)
+        self.assertEqual(result['timestamps'], [tp.isoformat() for tp in self.time_points])
+        self.assertEqual(result['total_posts'], 6)
+        self.assertEqual(result['platforms'], {'twitter': 3, 'reddit': 1})
+
+    def test_engagement(self):
+        """Engagement sums every metric per bucket and only counts in-range posts"""
+        result = self.convert(self.sample_posts())
+
+        self.assertEqual(result['engagement_counts'][0], 200)
+        self.assertEqual(result['engagement_counts'][14], 150)
+        self.assertEqual(result['engagement_counts'][23], 1175)
+        self.assertEqual(sum(result['engagement_counts']), 1525)
+        self.assertEqual(result['total_engagement'], 1525)
+
+    def test_sentiment(self):
+        """Bucket sentiment is a per-bucket mean and the overall average covers in-range posts only"""
+        result = self.convert(self.sample_posts())
+
+        self.assertAlmostEqual(result['sentiment_scores'][0], 0.5)
+        self.assertAlmostEqual(result['sentiment_scores'][14], 0.2)
+        self.assertAlmostEqual(result['sentiment_scores'][23], -0.1)
+        self.assertAlmostEqual(result['avg_sentiment'], (0.5 + 0.2 + 0.1 - 0.3) / 4)
+
+    def test_top_posts(self):
+        """Top posts are in-range posts above the threshold, highest engagement first"""
+        result = self.convert(self.sample_posts())
+
+        self.assertEqual(
+            [(post['content'], post['engagement']) for post in result['top_posts']],
+            [('last-edge...', 1125), ('first-edge...', 200), ('middle...', 150)]
+        )
+        self.assertEqual(result['top_posts'][0]['platform'], 'reddit')
+
+    def test_empty_input(self):
+        """No posts yields empty buckets and a zero average"""
+        result = self.convert([])
+
+        self.assertEqual(result['post_counts'], [0] * 24)
+        self.assertEqual(result['top_posts'], [])
+        self.assertEqual(result['total_engagement'], 0)
+        self.assertEqual(result['avg_sentiment'], 0.0)
+
+
+class TestCalculateTimeSpan(unittest.TestCase):
+    """Test the single-pass min/max fold over network node timestamps"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dashboard = load_dashboard()
+        cls.start = datetime(2026, 1, 15, 12, 0)
+
+    def test_empty_and_single(self):
+        """Fewer than two timestamped nodes has no span"""
+        self.assertEqual(self.dashboard.calculate_time_span([]), "N/A")
+        self.assertEqual(self.dashboard.calculate_time_span([{'timestamp': self.start.isoformat()}]), "N/A")
+        self.assertEqual(self.dashboard.calculate_time_span([{'id': 1}, {'id': 2}]), "N/A")
+
+    def test_unordered_nodes(self):
+        """The span runs from the earliest to the latest timestamp wherever they appear"""
+        nodes = [
+            {'timestamp': (self.start + timedelta(hours=2)).isoformat()},
+            {'timestamp': self.start + timedelta(hours=5)},
+            {'id': 'no-timestamp'},
+            {'timestamp': self.start.isoformat()},
+            {'timestamp': (self.start + timedelta(hours=1)).isoformat()}
+        ]
+        self.assertEqual(self.dashboard.calculate_time_span(nodes), "5 hours")
+
+    def test_units(self):
+        """Spans are reported in days, hours or minutes"""
+        def span(delta):
+            return self.dashboard.calculate_time_span([
+                {'timestamp': self.start.isoformat()},
+                {'timestamp': (self.start + delta).isoformat()}
+            ])
+
+        self.assertEqual(span(timedelta(days=3, hours=4)), "3 days")
+        self.assertEqual(span(timedelta(hours=2, minutes=30)), "2 hours")
+        self.assertEqual(span(timedelta(minutes=45)), "45 minutes")
+
+
+class TestTimelineDfKey(unittest.TestCase):
+    """Test the content hash used to key cached timeline figures"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.dashboard = load_dashboard()
+
+    def timeline(self, engagement=(10, 20, 30)):
+        return pd.DataFrame({
+            'timestamp': pd.date_range('2026-01-15', periods=3, freq='h'),
+            'engagement': np.array(engagement, dtype=np.int64),
+            'cumulative_reach': np.cumsum(engagement) * 1.5
+        })
+
+    def test_stable_across_copies(self):
+        """Equal content hashes the same, independent of object identity"""
+        key = self.dashboard.timeline_df_key(self.timeline())
+        self.assertEqual(self.dashboard.timeline_df_key(self.timeline()), key)
+        self.assertEqual(self.dashboard.timeline_df_key(self.timeline().copy()), key)
+        self.assertEqual(len(key), 32)
+
+    def test_changes_with_content(self):
+        """A changed value or column name gives a different key"""
+        key = self.dashboard.timeline_df_key(self.timeline())
+        self.assertNotEqual(self.dashboard.timeline_df_key(self.timeline((10, 20, 31))), key)
+        self.assertNotEqual(
+            self.dashboard.timeline_df_key(self.timeline().rename(columns={'engagement': 'views'})), key
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
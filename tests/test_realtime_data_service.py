@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Real-time Data Service Test Suite
+Tests post engagement totals and behavior pattern aggregation
+"""
+
+import unittest
+import sys
+import os
+from datetime import datetime, timedelta
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    from services.realtime.realtime_data_service import RealTimePost, RealTimeDataService
+    REALTIME_AVAILABLE = True
+except ImportError as e:
+    print(f"Warning: Could not import real-time data service: {e}")
+    REALTIME_AVAILABLE = False
+
+
+def make_post(post_id, timestamp, engagement):
+    return RealTimePost(
+        id=post_id,
+        platform='twitter',
+        content=f'post {post_id}',
+        author='analyst',
+        author_id='u1',
+        timestamp=timestamp,
+        url=f'https://x.com/analyst/status/{post_id}',
+        hashtags=[],
+        mentions=[],
+        engagement=engagement,
+        location=None,
+        language='en',
+        sentiment_score=0.0,
+        sentiment_label='neutral',
+        viral_score=0.0,
+        influence_score=0.0,
+        risk_level='low',
+        parent_post_id=None,
+        thread_id=None,
+        media_urls=[],
+        verified_author=False
+    )
+
+
+@unittest.skipUnless(REALTIME_AVAILABLE, "real-time data service dependencies not installed")
+class TestRealTimePost(unittest.TestCase):
+    """Test the precomputed engagement total"""
+
+    def test_engagement_total(self):
+        """engagement_total matches the sum of the engagement metrics"""
+        for engagement in ({'likes': 10, 'shares': 4, 'comments': 2, 'views': 300}, {'likes': 7}, {}):
+            post = make_post('1', datetime(2026, 1, 15, 12, 0), engagement)
+            self.assertEqual(post.engagement_total, sum(engagement.values()))
+
+    def test_engagement_total_ignored_in_equality(self):
+        """engagement_total is derived, so it is not a constructor argument or compared"""
+        first = make_post('1', datetime(2026, 1, 15, 12, 0), {'likes': 3})
+        second = make_post('1', datetime(2026, 1, 15, 12, 0), {'likes': 3})
+        self.assertEqual(first, second)
+
+
+@unittest.skipUnless(REALTIME_AVAILABLE, "real-time data service dependencies not installed")
+class TestBehaviorPatterns(unittest.TestCase):
+    """Test hourly posting frequency aggregation"""
+
+    def setUp(self):
+        # Skip __init__ so no platform clients are created
+        self.service = RealTimeDataService.__new__(RealTimeDataService)
+
+    def test_posting_frequency_is_dense(self):
+        """Every hour 0-23 is present in order and the counts sum to the post count"""
+        start = datetime(2026, 1, 15, 0, 30)
+        posts = [make_post(str(i), start + timedelta(hours=hour), {'likes': i})
+                 for i, hour in enumerate([0, 0, 5, 13, 13, 13, 23])]
+
+        frequency = self.service._analyze_behavior_patterns(posts)["posting_frequency"]
+
+        self.assertEqual(list(frequency), list(range(24)))
+        self.assertEqual(sum(frequency.values()), len(posts))
+        self.assertEqual((frequency[0], frequency[5], frequency[13], frequency[23]), (2, 1, 3, 1))
+        self.assertEqual(frequency[12], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tracking Cache Test Suite
+Tests batched lookups against the SQLite tracking cache
+"""
+
+import unittest
+import tempfile
+import sys
+import os
+
+# Add the project root to the path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.database.tracking_cache import TrackingCacheDB
+
+
+class TestGetCachedDataBatch(unittest.TestCase):
+    """Test mapping of batched IN-query rows back to the requested keys"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_db = TrackingCacheDB(os.path.join(self.tmp.name, 'tracking_cache.db'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hits_misses_and_expired(self):
+        """Fresh rows map to their keys; missing and expired keys map to None"""
+        self.cache_db.cache_data('twitter', 'hashtag', '#india', {'posts': 10})
+        self.cache_db.cache_data('reddit', 'hashtag', '#india', {'posts': 3})
+        self.cache_db.cache_data('youtube', 'hashtag', '#india', {'posts': 7}, cache_duration_hours=-1)
+
+        keys = [
+            ('twitter', 'hashtag', '#india'),
+            ('reddit', 'hashtag', '#india'),
+            ('youtube', 'hashtag', '#india'),
+            ('telegram', 'hashtag', '#india')
+        ]
+        results = self.cache_db.get_cached_data_batch(keys)
+
+        self.assertEqual(list(results), keys)
+        self.assertEqual(results[keys[0]].data, {'posts': 10})
+        self.assertEqual(results[keys[0]].platform, 'twitter')
+        self.assertEqual(results[keys[1]].data, {'posts': 3})
+        self.assertIsNone(results[keys[2]])
+        self.assertIsNone(results[keys[3]])
+
+    def test_matches_single_lookup(self):
+        """Each batched result agrees with get_cached_data for the same key"""
+        self.cache_db.cache_data('twitter', 'url', 'https://x.com/a/status/1', {'shares': 4})
+        keys = [('twitter', 'url', 'https://x.com/a/status/1'), ('twitter', 'url', 'https://x.com/a/status/2')]
+
+        results = self.cache_db.get_cached_data_batch(keys)
+
+        for key in keys:
+            self.assertEqual(results[key], self.cache_db.get_cached_data(*key))
+
+    def test_keys_sharing_a_cache_key(self):
+        """Query values are matched case-insensitively, so both spellings get the same row"""
+        self.cache_db.cache_data('twitter', 'keyword', 'Election', {'posts': 2})
+        keys = [('twitter', 'keyword', 'Election'), ('twitter', 'keyword', 'election')]
+
+        results = self.cache_db.get_cached_data_batch(keys)
+
+        self.assertEqual(results[keys[0]].data, {'posts': 2})
+        self.assertIs(results[keys[0]], results[keys[1]])
+
+    def test_empty_keys(self):
+        """An empty batch returns an empty mapping without querying"""
+        self.assertEqual(self.cache_db.get_cached_data_batch([]), {})
+
+
+if __name__ == '__main__':
+    unittest.main()